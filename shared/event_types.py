@@ -51,6 +51,8 @@ class Events:
     - 新しいコードは payload["message"], payload["user_name"] を使用してください
     """
 
+    ONECOMME_COMMENT_BATCH = "ONECOMME_COMMENT_BATCH"  # ONECOMME_COMMENT payload のリスト（受信まとめ配信）
+
     # ai
     AI_REQUEST = "AI_REQUEST"           # 下流AIへ「生成依頼」
     AI_RESPONSE = "AI_RESPONSE"         # AIからの返答（推奨）
@@ -111,6 +113,7 @@ CONFIG_UPDATE = Events.CONFIG_UPDATE
 
 CHAT_MESSAGE = Events.CHAT_MESSAGE
 ONECOMME_COMMENT = Events.ONECOMME_COMMENT
+ONECOMME_COMMENT_BATCH = Events.ONECOMME_COMMENT_BATCH
 VOICE_PLAY = Events.VOICE_PLAY
 VOICE_REQUEST = Events.VOICE_REQUEST
 STREAMER_PROFILE_READY = Events.STREAMER_PROFILE_READY
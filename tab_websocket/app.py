@@ -11,20 +11,47 @@ from __future__ import annotations
 import os
 import sys
 import logging
-from datetime import datetime
+import importlib
+import time
+from types import MappingProxyType, SimpleNamespace
 import tkinter as tk
 from tkinter import ttk
 
 # ===== パス調整（プロジェクト直下/同階層フォールバック） =====
 CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_ROOT = os.path.dirname(CURRENT_DIR)
-for p in (CURRENT_DIR, PROJECT_ROOT, os.path.join(PROJECT_ROOT, "shared")):
-    if p and p not in sys.path:
-        sys.path.insert(0, p)
+# sys.path は一度だけ set 化して走査し、不足分をまとめて先頭へ追加する
+# （従来の insert(0, ...) 連続と同じく shared → PROJECT_ROOT → CURRENT_DIR の優先順）
+_existing_paths = set(sys.path)
+_missing_paths = [
+    p for p in dict.fromkeys((os.path.join(PROJECT_ROOT, "shared"), PROJECT_ROOT, CURRENT_DIR))
+    if p and p not in _existing_paths
+]
+if _missing_paths:
+    sys.path[:0] = _missing_paths
+    importlib.invalidate_caches()
+del _existing_paths, _missing_paths
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# ===== 接続状態パネルの配色・フォント（ウィジェット生成ごとに作り直さない） =====
+_FONT_NORMAL = ("Arial", 9)
+_FONT_BOLD = ("Arial", 9, "bold")
+_BG_DARK = "#2b2b2b"
+_FG_OK = "#90EE90"
+_FG_NG = "#FF4444"
+_STATUS_CELL_STYLE = "StatusCell.TLabel"
+_AI_CHAR_TITLE = "AIキャラ:"
+
+# ===== AI_STATUS_UPDATE 表示用（イベントごとに作り直さない） =====
+_PROVIDER_DISPLAY = MappingProxyType({
+    "gemini": "Gemini",
+    "openai": "OpenAI",
+    "anthropic": "Claude",
+})
+_FALLBACK_PROVIDERS = frozenset({"fallback", "local-echo", "echo"})
+
 # ===== 共有モジュール（安全インポート） =====
 # EventTypes
 Events = None
@@ -37,18 +64,18 @@ except Exception:
         from event_types import Events as _Events
         Events = _Events
     except Exception:
-        class _CompatEvents:
-            # 最後の砦：最低限のキーだけ用意
-            WS_CONNECT         = "WS_CONNECT"
-            WS_DISCONNECT      = "WS_DISCONNECT"
-            WS_STATUS          = "WS_STATUS"
-            WEBSOCKET_CONNECT  = "WS_CONNECT"
-            WEBSOCKET_DISCONNECT = "WS_DISCONNECT"
-            WEBSOCKET_LOG      = "WEBSOCKET_LOG"
-            ONECOMME_COMMENT   = "ONECOMME_COMMENT"
-            CHAT_MESSAGE       = "CHAT_MESSAGE"
-            TAB_READY          = "TAB_READY"
-        Events = _CompatEvents()  # type: ignore
+        # 最後の砦：最低限のキーだけ用意（SimpleNamespace なので setattr でそのまま別名追加可）
+        Events = SimpleNamespace(  # type: ignore
+            WS_CONNECT="WS_CONNECT",
+            WS_DISCONNECT="WS_DISCONNECT",
+            WS_STATUS="WS_STATUS",
+            WEBSOCKET_CONNECT="WS_CONNECT",
+            WEBSOCKET_DISCONNECT="WS_DISCONNECT",
+            WEBSOCKET_LOG="WEBSOCKET_LOG",
+            ONECOMME_COMMENT="ONECOMME_COMMENT",
+            CHAT_MESSAGE="CHAT_MESSAGE",
+            TAB_READY="TAB_READY",
+        )
         logger.warning("⚠️ event_types を読み込めなかったため簡易互換を使用します")
 
 # MessageBus
@@ -157,7 +184,7 @@ def _ensure_event_aliases():
             setattr(Events, "WEBSOCKET_LOG", ws_log)
 
     except Exception as e:
-        logger.error(f"❌ イベント互換マッピング失敗: {e}")
+        logger.error("❌ イベント互換マッピング失敗: %s", e)
 
 _ensure_event_aliases()
 
@@ -184,6 +211,19 @@ def _event(name: str, legacy: str | None = None):
     return name
 
 
+# ===== 高頻度ハンドラ用の INFO ログ間引き =====
+_last_log_ts: dict[str, float] = {}
+
+
+def _log_ok(key: str, period: float = 1.0) -> bool:
+    """key ごとに period 秒に1回だけ True を返す（上流の連打でログI/Oが支配的にならないように）"""
+    now = time.monotonic()
+    if now - _last_log_ts.get(key, 0.0) >= period:
+        _last_log_ts[key] = now
+        return True
+    return False
+
+
 # ===== タブ本体 =====
 class WebSocketTab(ttk.Frame):
     """
@@ -203,12 +243,18 @@ class WebSocketTab(ttk.Frame):
 
         self._bridge = None
         self._subs = []  # 解除用トークンや (event, callback) の記録
+        self._last_ai_state = None  # 直近に反映した (provider, model, connected)
+        self._default_ws_url = None  # 既定の接続URL（CONFIG_UPDATE で破棄して再解決）
 
         # カウンター変数
         self.comment_count = 0
         self.ai_response_count = 0
         self.voice_request_count = 0
         self.error_count = 0
+        self._stats_flush_pending = False
+
+        # 状態バー変数は UI 構築前に用意（以降の _set_status は無条件に set できる）
+        self.status_var = tk.StringVar(master=self, value="⏳ 準備中…")
 
         self._build_ui()
         self._subscribe_events()
@@ -233,15 +279,22 @@ class WebSocketTab(ttk.Frame):
             fallback.pack(fill=tk.X, padx=10, pady=6)
             ttk.Label(fallback, text="接続UIを読み込めませんでした。").pack(padx=10, pady=10)
 
-        # 3. 状態バー（下）
-        self.status_var = tk.StringVar(value="⏳ 準備中…")
-
     def _create_connection_status_panel(self, parent):
         """
         接続状態パネル（Chatタブから移動）
         - 1段目：MessageBus/VoiceManager/ConfigManager/AIキャラ の4つのステータス枠（左寄せ）
         - 2段目：カウンター + テストボタン（左寄せ）
         """
+        ttk.Style(self).configure(
+            _STATUS_CELL_STYLE,
+            background=_BG_DARK,
+            foreground=_FG_OK,
+            font=_FONT_BOLD,
+            borderwidth=1,
+            relief="ridge",
+            padding=(6, 2),
+        )
+
         status_frame = ttk.LabelFrame(parent, text="📡 接続状態", padding="10")
         status_frame.pack(fill=tk.X, padx=10, pady=(10, 10))
 
@@ -249,46 +302,30 @@ class WebSocketTab(ttk.Frame):
         status_row = ttk.Frame(status_frame)
         status_row.pack(fill=tk.X, pady=(0, 8), anchor="w")
 
-        # MessageBus ステータス
         messagebus_status = "✅ 接続済み" if self.bus else "❌ 未接続"
-
-        mb_frame = tk.Frame(status_row, bg="#2b2b2b", relief=tk.RIDGE, borderwidth=1)
-        mb_frame.pack(side=tk.LEFT, padx=(0, 10))
-        tk.Label(mb_frame, text="MessageBus: ", bg="#2b2b2b", fg="white", font=("Arial", 9)).pack(side=tk.LEFT, padx=(5, 0))
-        self.messagebus_status_label = tk.Label(mb_frame, text=messagebus_status, fg="#90EE90", bg="#2b2b2b", font=("Arial", 9, "bold"))
-        self.messagebus_status_label.pack(side=tk.LEFT, padx=(0, 5))
-
-        # VoiceManager ステータス
         voice_status = "✅ 利用可能" if VOICE_SINGLETON_AVAILABLE else "❌ 未初期化"
-
-        vm_frame = tk.Frame(status_row, bg="#2b2b2b", relief=tk.RIDGE, borderwidth=1)
-        vm_frame.pack(side=tk.LEFT, padx=(0, 10))
-        tk.Label(vm_frame, text="VoiceManager: ", bg="#2b2b2b", fg="white", font=("Arial", 9)).pack(side=tk.LEFT, padx=(5, 0))
-        self.voice_status_label = tk.Label(vm_frame, text=voice_status, fg="#90EE90", bg="#2b2b2b", font=("Arial", 9, "bold"))
-        self.voice_status_label.pack(side=tk.LEFT, padx=(0, 5))
-
-        # ConfigManager ステータス
         config_status = "✅ 利用可能" if CONFIG_MANAGER_AVAILABLE else "❌ 未初期化"
 
-        cm_frame = tk.Frame(status_row, bg="#2b2b2b", relief=tk.RIDGE, borderwidth=1)
-        cm_frame.pack(side=tk.LEFT, padx=(0, 10))
-        tk.Label(cm_frame, text="ConfigManager: ", bg="#2b2b2b", fg="white", font=("Arial", 9)).pack(side=tk.LEFT, padx=(5, 0))
-        self.config_status_label = tk.Label(cm_frame, text=config_status, fg="#90EE90", bg="#2b2b2b", font=("Arial", 9, "bold"))
-        self.config_status_label.pack(side=tk.LEFT, padx=(0, 5))
-
-        # AIキャラ ステータス
-        ai_char_frame = tk.Frame(status_row, bg="#2b2b2b", relief=tk.RIDGE, borderwidth=1)
-        ai_char_frame.pack(side=tk.LEFT)
-        tk.Label(ai_char_frame, text="AIキャラ: ", bg="#2b2b2b", fg="white", font=("Arial", 9)).pack(side=tk.LEFT, padx=(5, 0))
-        self.ai_character_label = tk.Label(ai_char_frame, text="確認中...", fg="#90EE90", bg="#2b2b2b", font=("Arial", 9, "bold"))
-        self.ai_character_label.pack(side=tk.LEFT, padx=(0, 5))
+        # 各枠は StatusCell.TLabel スタイルの ttk.Label 1個（Frame + Label×2 をまとめる）
+        # (タイトル, 初期値, ラベルの保存先属性)
+        cells = (
+            ("MessageBus:", messagebus_status, "messagebus_status_label"),
+            ("VoiceManager:", voice_status, "voice_status_label"),
+            ("ConfigManager:", config_status, "config_status_label"),
+            (_AI_CHAR_TITLE, "確認中...", "ai_character_label"),
+        )
+        last = len(cells) - 1
+        for i, (title, initial_text, attr) in enumerate(cells):
+            label = ttk.Label(status_row, text=f"{title} {initial_text}", style=_STATUS_CELL_STYLE)
+            label.pack(side=tk.LEFT, padx=(0, 10) if i < last else 0)
+            setattr(self, attr, label)
 
         # 2段目：カウント表示のみ（左寄せ）
         counter_row = ttk.Frame(status_frame)
         counter_row.pack(fill=tk.X, anchor="w", pady=(4, 0))
 
         # カウント表示（左端）
-        self.stats_label = tk.Label(counter_row, text="受信: 0 | AI応答: 0 | 音声: 0 | エラー: 0", fg="#FFD700", bg="#2b2b2b", font=("Arial", 9))
+        self.stats_label = tk.Label(counter_row, text="受信: 0 | AI応答: 0 | 音声: 0 | エラー: 0", fg="#FFD700", bg=_BG_DARK, font=_FONT_NORMAL)
         self.stats_label.pack(side=tk.LEFT)
 
     def send_test_message(self):
@@ -300,7 +337,7 @@ class WebSocketTab(ttk.Frame):
             self.bus.publish("TEST_MESSAGE", {"text": "テストメッセージ", "source": "websocket_tab"}, sender="websocket_tab")
             logger.info("📡 テストメッセージ送信完了")
         except Exception as e:
-            logger.error(f"❌ テストメッセージ送信エラー: {e}")
+            logger.error("❌ テストメッセージ送信エラー: %s", e)
 
     def _test_voice_singleton(self):
         """音声テスト"""
@@ -312,7 +349,7 @@ class WebSocketTab(ttk.Frame):
             speak_text("音声テスト成功", username="System")
             logger.info("🎤 音声テスト実行")
         except Exception as e:
-            logger.error(f"❌ 音声テストエラー: {e}")
+            logger.error("❌ 音声テストエラー: %s", e)
 
     # --- Bus 購読 ---
     def _subscribe_events(self):
@@ -320,13 +357,22 @@ class WebSocketTab(ttk.Frame):
             self._set_status("❌ MessageBus 未接続")
             return
 
+        # 解決後のイベント値が同じ (ONECOMME_COMMENT と CHAT_MESSAGE が同一チャンネル等) なら
+        # 同じコールバックを二重登録しない（カウンターの二重加算防止）
+        seen = set()
+
         def sub(ev, cb):
+            key = (getattr(ev, "value", ev), cb)
+            if key in seen:
+                logger.debug("📝 subscribe スキップ（重複）: %s", ev)
+                return
+            seen.add(key)
             try:
                 token = self.bus.subscribe(ev, cb)
                 self._subs.append(token if token is not None else (ev, cb))
-                logger.debug(f"📝 subscribe: {ev}")
+                logger.debug("📝 subscribe: %s", ev)
             except Exception as e:
-                logger.error(f"❌ subscribe 失敗: {ev} -> {e}")
+                logger.error("❌ subscribe 失敗: %s -> %s", ev, e)
 
         # 新旧どちらのキーでも必ず拾えるように、安全に解決して購読
         ev_connect    = _event("WS_CONNECT",    "WEBSOCKET_CONNECT")
@@ -335,6 +381,10 @@ class WebSocketTab(ttk.Frame):
         sub(ev_connect, self._on_ws_connect)
         sub(ev_disconnect, self._on_ws_disconnect)
 
+        # 設定変更で既定URLキャッシュを破棄
+        if hasattr(Events, "CONFIG_UPDATE"):
+            sub(Events.CONFIG_UPDATE, self._on_config_update)
+
         # AI_STATUS_UPDATE を購読（AIキャラ状態ラベル更新用）
         if hasattr(Events, "AI_STATUS_UPDATE"):
             sub(Events.AI_STATUS_UPDATE, self._on_ai_status_update)
@@ -359,19 +409,33 @@ class WebSocketTab(ttk.Frame):
     def _notify_tab_ready(self):
         try:
             if self.bus and hasattr(Events, "TAB_READY"):
-                data = {"tab": "websocket", "ts": datetime.now().isoformat()}
+                data = {"tab": "websocket", "ts": time.time()}  # epoch 秒（購読側で必要なら整形）
                 self.bus.publish(Events.TAB_READY, data, sender="tab_websocket")
         except Exception:
             pass
 
     # --- 状態バー更新 ---
     def _set_status(self, text: str):
-        try:
-            self.status_var.set(text)
-        except Exception:
-            pass
+        self.status_var.set(text)
 
     # --- 接続要求 ---
+    def _resolve_default_ws_url(self) -> str:
+        """既定URLを返す（config 参照は初回と CONFIG_UPDATE 後のみ）"""
+        if self._default_ws_url is None:
+            url = ""
+            try:
+                if self.config and hasattr(self.config, "get"):
+                    url = self.config.get("websocket.onecomme.url", "")
+            except Exception:
+                pass
+            # ★ 最終フォールバック（OneComme v8 の標準ポート）
+            self._default_ws_url = url or "ws://127.0.0.1:22280/ws"
+        return self._default_ws_url
+
+    def _on_config_update(self, data=None, sender=None):
+        """設定変更 → 既定URLキャッシュを破棄"""
+        self._default_ws_url = None
+
     def _on_ws_connect(self, data, sender=None):
         """
         data: {"url": "ws://.."} を期待
@@ -383,24 +447,12 @@ class WebSocketTab(ttk.Frame):
         except Exception:
             pass
 
-        # UnifiedConfigManager からの既定値（無ければローカル既定にフォールバック）
+        # UnifiedConfigManager からの既定値（初回のみ解決してキャッシュ）
         if not url:
-            try:
-                if self.config and hasattr(self.config, "get"):
-                    url = self.config.get("websocket.onecomme.url", "")
-            except Exception:
-                pass
+            url = self._resolve_default_ws_url()
 
-        if not url:
-            # ★ 最終フォールバック（OneComme v8 の標準ポート）
-            url = "ws://127.0.0.1:22280/ws"
-
-        try:
-            logging.getLogger("tab_websocket").info(
-                f"🔗 WebSocket connect request: url={url}"
-            )
-        except Exception:
-            pass
+        if _log_ok("ws_connect"):
+            logger.info("🔗 WebSocket connect request: url=%s", url)
 
         if not url:
             self._set_status("⚠️ URL 不明のため接続できません")
@@ -414,7 +466,7 @@ class WebSocketTab(ttk.Frame):
             self._bridge = init_bridge(self.bus, url)
             self._set_status(f"✅ 接続開始: {url}")
         except Exception as e:
-            logger.error(f"❌ Bridge 初期化エラー: {e}")
+            logger.error("❌ Bridge 初期化エラー: %s", e)
             self._set_status(f"❌ 接続エラー: {e}")
 
     # --- 切断要求 ---
@@ -426,7 +478,7 @@ class WebSocketTab(ttk.Frame):
             else:
                 self._set_status("🛑 切断要求 → stop_bridge 未実装")
         except Exception as e:
-            logger.error(f"❌ 切断処理エラー: {e}")
+            logger.error("❌ 切断処理エラー: %s", e)
             self._set_status(f"❌ 切断エラー: {e}")
 
     # --- AI_STATUS_UPDATE 受信 ---
@@ -453,7 +505,7 @@ class WebSocketTab(ttk.Frame):
             fallback_only = bool(data.get("fallback_only", False))
 
             # フォールバックモード判定
-            if is_fallback or provider in ['fallback', 'local-echo', 'echo']:
+            if is_fallback or provider in _FALLBACK_PROVIDERS:
                 connected = False
             # 正常接続判定
             elif connector_ok and (has_key is None or has_key is True) and not standalone and not fallback_only:
@@ -461,82 +513,118 @@ class WebSocketTab(ttk.Frame):
             else:
                 connected = False
 
-            logger.info(f"🔍 [Task C - WebSocket] AI状態: provider={provider}, model={model}, connected={connected}")
+            logger.debug(
+                "🔍 [Task C - WebSocket] AI状態: provider=%s, model=%s, connected=%s",
+                provider, model, connected,
+            )
+
+            # 前回と同じ状態なら再描画・INFOログを省略（定期ハートビート対策）
+            new_state = (provider, model, connected)
+            if new_state == self._last_ai_state:
+                return
+            self._last_ai_state = new_state
 
             if hasattr(self, "ai_character_label") and self.ai_character_label:
-                if connected and provider not in ['fallback', 'local-echo', 'echo']:
-                    # プロバイダー名を整形
-                    provider_display = {
-                        'gemini': 'Gemini',
-                        'openai': 'OpenAI',
-                        'anthropic': 'Claude',
-                    }.get(provider.lower(), provider.capitalize())
+                if connected and provider not in _FALLBACK_PROVIDERS:
+                    # プロバイダー名を整形（小文字で来るのが通常なので lower() は未登録時のみ）
+                    provider_display = _PROVIDER_DISPLAY.get(provider)
+                    if provider_display is None:
+                        provider_display = _PROVIDER_DISPLAY.get(provider.lower(), provider.capitalize())
 
                     # "Gemini / gemini-2.5-flash" のような形式で表示
                     ai_char_text = f"{provider_display} / {model}"
-                    ai_char_color = "#90EE90"  # 明るい緑
+                    ai_char_color = _FG_OK  # 明るい緑
                 else:
                     ai_char_text = "未接続"
-                    ai_char_color = "#FF4444"  # 赤
+                    ai_char_color = _FG_NG  # 赤
 
-                self.ai_character_label.config(text=ai_char_text, fg=ai_char_color)
-                logger.info(f"✅ [Task C - WebSocket] AIキャラ表示更新: {ai_char_text}")
+                self.ai_character_label.configure(text=f"{_AI_CHAR_TITLE} {ai_char_text}", foreground=ai_char_color)
+                if _log_ok("ai_status"):
+                    logger.info("✅ [Task C - WebSocket] AIキャラ表示更新: %s", ai_char_text)
 
         except Exception as e:
-            logger.error(f"❌ AI_STATUS_UPDATE 処理エラー: {e}", exc_info=True)
+            logger.error("❌ AI_STATUS_UPDATE 処理エラー: %s", e, exc_info=True)
 
     # --- カウンター更新ハンドラ ---
     def _on_comment_received(self, data, sender=None):
         """コメント受信時のカウント更新"""
-        try:
-            self.comment_count += 1
-            self._update_stats_display()
-        except Exception as e:
-            logger.error(f"❌ コメントカウント更新エラー: {e}")
+        self.comment_count += 1
+        self._schedule_stats_flush()
 
     def _on_ai_response(self, data, sender=None):
         """AI応答時のカウント更新"""
-        try:
-            self.ai_response_count += 1
-            self._update_stats_display()
-        except Exception as e:
-            logger.error(f"❌ AI応答カウント更新エラー: {e}")
+        self.ai_response_count += 1
+        self._schedule_stats_flush()
 
     def _on_voice_request(self, data, sender=None):
         """音声リクエスト時のカウント更新"""
+        self.voice_request_count += 1
+        self._schedule_stats_flush()
+
+    def _schedule_stats_flush(self):
+        """統計表示の更新を after_idle にまとめる（連続イベントでも描画は1回）"""
+        if self._stats_flush_pending:
+            return
+        self._stats_flush_pending = True
         try:
-            self.voice_request_count += 1
-            self._update_stats_display()
+            self.after_idle(self._flush_stats)
         except Exception as e:
-            logger.error(f"❌ 音声リクエストカウント更新エラー: {e}")
+            # ウィジェット破棄後など：次のイベントで再スケジュールできるよう戻す
+            self._stats_flush_pending = False
+            logger.debug("統計表示の更新予約に失敗: %s", e)
+
+    def _flush_stats(self):
+        """予約された統計表示の更新を実行"""
+        self._stats_flush_pending = False
+        try:
+            self._update_stats_display()
+        except Exception:
+            logger.exception("❌ 統計表示更新エラー")
 
     def _update_stats_display(self):
         """統計表示を更新"""
-        try:
-            self.stats_label.config(
-                text=f"受信: {self.comment_count} | AI応答: {self.ai_response_count} | 音声: {self.voice_request_count} | エラー: {self.error_count}"
-            )
-        except Exception as e:
-            logger.error(f"❌ 統計表示更新エラー: {e}")
+        self.stats_label.config(
+            text=f"受信: {self.comment_count} | AI応答: {self.ai_response_count} | 音声: {self.voice_request_count} | エラー: {self.error_count}"
+        )
 
     # --- クリーンアップ（メイン終了時/タブ破棄時に呼び出し想定） ---
-    def cleanup(self):
-        try:
-            # 購読解除
-            if self.bus and hasattr(self.bus, "unsubscribe"):
-                for token in list(self._subs):
+    def _unsubscribe_all(self):
+        """購読を一括解除（unsubscribe_many があれば1回で、無ければ1件ずつ）"""
+        bus = self.bus
+        subs = self._subs
+        if not bus or not subs:
+            subs.clear()
+            return
+
+        bulk = getattr(bus, "unsubscribe_many", None)
+        if bulk:
+            try:
+                bulk(list(subs))
+                subs.clear()
+                return
+            except Exception as e:
+                logger.debug("unsubscribe_many 失敗、個別解除へ: %s", e)
+
+        unsubscribe = getattr(bus, "unsubscribe", None)
+        if unsubscribe:
+            for token in subs:
+                try:
+                    unsubscribe(token)  # token 型/ (ev,cb) どちらも対応する実装を想定
+                except TypeError:
+                    # (ev, cb) 形式だった場合
                     try:
-                        self.bus.unsubscribe(token)  # token 型/ (ev,cb) どちらも対応する実装を想定
-                    except TypeError:
-                        # (ev, cb) 形式だった場合
-                            try:
-                                ev, cb = token
-                                self.bus.unsubscribe(ev, cb)
-                            except Exception:
-                                pass
+                        ev, cb = token
+                        unsubscribe(ev, cb)
                     except Exception:
                         pass
-            self._subs.clear()
+                except Exception:
+                    pass
+        subs.clear()
+
+    def cleanup(self):
+        try:
+            # 購読解除
+            self._unsubscribe_all()
 
             # ブリッジ停止
             if _stop_bridge:
@@ -545,7 +633,7 @@ class WebSocketTab(ttk.Frame):
                 except Exception:
                     pass
         except Exception as e:
-            logger.error(f"❌ WebSocketTab.cleanup エラー: {e}")
+            logger.error("❌ WebSocketTab.cleanup エラー: %s", e)
 
 # ===== 生成関数（メインから呼ばれる想定） =====
 def create_websocket_tab(parent, message_bus=None, config_manager=None, app_instance=None, **kwargs) -> WebSocketTab:
@@ -577,13 +665,15 @@ if __name__ == "__main__":
     if get_bus:
         bus = get_bus()  # ✅ シングルトン取得
     else:
+        from collections import defaultdict
+
         class _MiniBus:
             def __init__(self):
-                self._subs = {}
+                self._subs = defaultdict(list)
 
             def subscribe(self, ev, cb):
                 key = getattr(ev, "name", ev) if hasattr(ev, "name") else ev
-                self._subs.setdefault(key, []).append(cb)
+                self._subs[key].append(cb)
                 print(f"[mini-bus] subscribe: {key}")
                 return (key, cb)
 
@@ -592,14 +682,18 @@ if __name__ == "__main__":
                     key, cb = token_or_ev
                 else:
                     key = token_or_ev
-                arr = self._subs.get(key, [])
-                if cb in arr:
+                arr = self._subs.get(key)
+                if arr and cb in arr:
                     arr.remove(cb)
 
             def publish(self, ev, data=None, sender=None):
                 key = getattr(ev, "name", ev) if hasattr(ev, "name") else ev
                 print(f"[mini-bus] publish: {key} from {sender} data={data}")
-                for cb in self._subs.get(key, []):
+                cbs = self._subs.get(key)
+                if not cbs:
+                    return
+                # 配信中の subscribe/unsubscribe に影響されないようスナップショットで回す
+                for cb in tuple(cbs):
                     try:
                         cb(data, sender)
                     except Exception as e:
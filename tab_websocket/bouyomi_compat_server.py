@@ -8,13 +8,111 @@ Multi Comment Viewer (MCV) などの棒読みちゃん連携アプリから
 プロトコル仕様: docs/BOUYOMI_PROTOCOL_SPEC.md 参照
 """
 import asyncio
+import codecs
 import struct
 import time
 import logging
-from typing import Optional, Dict, Any
+import weakref
+from typing import Optional, Dict, Any, List, Tuple
 
 logger = logging.getLogger(__name__)
 
+# ヘッダー構造（フォーマット解析はロード時の1回だけ）
+_HDR15 = struct.Struct('<HHHHHbi')  # cmd, speed, tone, volume, voice, char_code, msg_length
+_HDR12 = struct.Struct('<HHHHHH')   # cmd, speed, tone, volume, voice, text_length
+
+_READ_CHUNK = 65536        # 1回の受信で読む最大バイト数
+_MAX_BODY = 1024 * 1024    # 本文長の上限（壊れたヘッダーで無限に待たないように）
+_IDLE_TIMEOUT = 30.0       # 無通信でこの秒数が経過したら切断
+
+
+# レイアウト別のヘッダー読み取り（分岐なしで共通の9要素タプルを返す）
+def _parse_hdr15(buf, offset: int, _unpack=_HDR15.unpack_from, _size=_HDR15.size):
+    command, speed, tone, volume, voice, char_code, msg_length = _unpack(buf, offset)
+    return command, speed, tone, volume, voice, char_code, msg_length, _size, "15byte"
+
+
+def _parse_hdr12(buf, offset: int, _unpack=_HDR12.unpack_from, _size=_HDR12.size):
+    command, speed, tone, volume, voice, msg_length = _unpack(buf, offset)
+    # 12バイト版は Shift_JIS 固定
+    return command, speed, tone, volume, voice, 2, msg_length, _size, "12byte"
+
+
+# コマンド → (ヘッダー長, 読み取り関数)。0x0001 (Talk) は15バイト版、それ以外は12バイト版として扱う
+_CMD_TO_LAYOUT = {
+    0x0001: (_HDR15.size, _parse_hdr15),
+}
+_DEFAULT_LAYOUT = (_HDR12.size, _parse_hdr12)
+
+
+def parse_header(buf, offset: int = 0) -> Optional[Tuple[int, int, int, int, int, int, int, int, str]]:
+    """
+    ヘッダー解析（本文は読まない）
+
+    bytes / bytearray / memoryview のどれでもコピーせずに読める。
+
+    Args:
+        buf: 受信バッファ
+        offset: フレーム先頭位置
+
+    Returns:
+        (command, speed, tone, volume, voice, char_code, msg_length, header_size, protocol_version)
+        ヘッダーが揃っていない場合は None
+    """
+    available = len(buf) - offset
+    if available < 2:
+        return None
+
+    # 先頭2バイトのコマンドでヘッダー形式を決める（解析の空振り＋例外を避ける）
+    header_size, parse = _CMD_TO_LAYOUT.get(buf[offset] | (buf[offset + 1] << 8), _DEFAULT_LAYOUT)
+    if available < header_size:
+        return None
+    return parse(buf, offset)
+
+
+# 空テキストのフレーム（エラーではないが配信もしない）を表す番兵
+_SKIPPED: Dict[str, Any] = {}
+
+# ONECOMME_COMMENT payload の "data" のうち毎回同じ値のキー
+_DATA_TEMPLATE: Dict[str, Any] = {
+    "hasGift": False,
+    "isPinned": False,
+    "isMembership": False,
+    "isOwner": False,
+    "service": "MultiCommentViewer",
+}
+
+# 複数コメントをまとめて配信するトピック（各要素は ONECOMME_COMMENT と同じ payload）
+ONECOMME_COMMENT_BATCH = "ONECOMME_COMMENT_BATCH"
+
+# BATCH → ONECOMME_COMMENT 展開 shim を登録済みのバス
+_fanout_buses = weakref.WeakSet()
+
+
+def _ensure_batch_fanout(message_bus) -> bool:
+    """
+    ONECOMME_COMMENT_BATCH を1件ずつ ONECOMME_COMMENT に展開し直す shim をバスごとに1回だけ登録
+
+    ONECOMME_COMMENT しか購読していない既存の受け手もそのまま動くようにする。
+
+    Returns:
+        shim が使える場合 True（False ならバッチ配信せず1件ずつ publish する）
+    """
+    try:
+        if message_bus in _fanout_buses:
+            return True
+
+        def _fanout(batch, sender=None):
+            for payload in batch:
+                message_bus.publish("ONECOMME_COMMENT", payload, sender=sender)
+
+        message_bus.subscribe(ONECOMME_COMMENT_BATCH, _fanout)
+        _fanout_buses.add(message_bus)
+        return True
+    except Exception as e:
+        logger.debug("BATCH展開 shim を登録できないため個別配信します: %s", e)
+        return False
+
 
 class BouyomiCompatServer:
     """
@@ -47,6 +145,19 @@ class BouyomiCompatServer:
         self.error_count = 0
         self.last_message_time = 0
 
+        # 直近の _log_to_bus (時刻, (level, msg))：再接続ループ等での連投抑制用
+        self._last_log = (0.0, None)
+
+        # まとめて配信できるか（start 時に shim を登録して決める）
+        self._batch_fanout = False
+
+        # 文字コード別デコーダー（コーデック検索を毎回しないよう事前解決。final=True で呼ぶので状態は持ち越さない）
+        self._decoders = {
+            0: codecs.getincrementaldecoder('utf-8')(errors='ignore').decode,
+            1: codecs.getincrementaldecoder('utf-16-le')(errors='ignore').decode,
+            2: codecs.getincrementaldecoder('shift_jis')(errors='ignore').decode,
+        }
+
         logger.info(f"📢 BouyomiCompatServer 初期化: {host}:{port}")
 
     async def start(self) -> bool:
@@ -69,6 +180,7 @@ class BouyomiCompatServer:
 
             self._running = True
             self._shutdown_event.clear()
+            self._batch_fanout = _ensure_batch_fanout(self.message_bus)
 
             # サーバータスク開始
             self.server_task = asyncio.create_task(
@@ -146,145 +258,165 @@ class BouyomiCompatServer:
         self.connection_count += 1
         conn_id = self.connection_count
 
-        logger.info(f"🔌 BouyomiCompat接続 #{conn_id}: {addr}")
+        logger.info("🔌 BouyomiCompat接続 #%d: %s", conn_id, addr)
         self._log_to_bus("info", f"接続 #{conn_id}: {addr}")
 
+        # 受信バッファ（StreamReader からまとめて受け取り、フレームはその場で解析）
+        buf = bytearray()
+
+        # 無通信タイムアウト：読むたびに wait_for でタイマーを作らず、接続ごとに1本の監視タイマーで見る
+        loop = asyncio.get_running_loop()
+        last_activity = loop.time()
+        timed_out = False
+
+        def _check_idle():
+            nonlocal idle_handle, timed_out
+            remaining = last_activity + _IDLE_TIMEOUT - loop.time()
+            if remaining > 0:
+                idle_handle = loop.call_later(remaining, _check_idle)
+            else:
+                # 切断すると reader.read() が空を返してループが終わる
+                timed_out = True
+                writer.close()
+
+        idle_handle = loop.call_later(_IDLE_TIMEOUT, _check_idle)
+
         try:
             while not self._shutdown_event.is_set():
-                # ヘッダー読み込み（最大15バイト）
-                header_data = await asyncio.wait_for(
-                    reader.read(15),
-                    timeout=30.0
-                )
+                chunk = await reader.read(_READ_CHUNK)
 
-                if not header_data:
+                if not chunk:
                     # 接続終了
+                    if timed_out:
+                        logger.debug("📢 接続 #%d タイムアウト（正常）: %s", conn_id, addr)
                     break
 
-                # パケット解析
-                result = await self._parse_packet(header_data, reader)
+                last_activity = loop.time()
+                buf.extend(chunk)
 
-                if result:
-                    # MessageBusに配信
-                    await self._publish_comment(result, conn_id, addr)
-                    self.message_count += 1
+                results = self._drain_frames(buf)
+                if results:
+                    # MessageBusに配信（1回の受信で複数届いた分はまとめて）
+                    self._publish_comments(results, conn_id)
                     self.last_message_time = time.time()
-                else:
-                    self.error_count += 1
 
-        except asyncio.TimeoutError:
-            logger.debug(f"📢 接続 #{conn_id} タイムアウト（正常）: {addr}")
         except asyncio.CancelledError:
-            logger.debug(f"📢 接続 #{conn_id} キャンセル: {addr}")
+            logger.debug("📢 接続 #%d キャンセル: %s", conn_id, addr)
             raise
         except Exception as e:
             logger.error(f"❌ 接続 #{conn_id} エラー: {e}")
             self.error_count += 1
         finally:
+            idle_handle.cancel()
             try:
                 writer.close()
                 await writer.wait_closed()
             except Exception:
                 pass
 
-            logger.info(f"🔌 BouyomiCompat切断 #{conn_id}: {addr}")
+            logger.info("🔌 BouyomiCompat切断 #%d: %s", conn_id, addr)
 
-    async def _parse_packet(
+    def _drain_frames(self, buf: bytearray) -> List[Dict[str, Any]]:
+        """
+        バッファから完結しているフレームをすべて取り出す
+
+        解析済みの部分は最後に1回だけ del buf[:offset] で捨てる。
+        途中までしか届いていないフレームはバッファに残し、次の受信を待つ。
+
+        Args:
+            buf: 受信バッファ（解析済み部分はこの中で削除される）
+
+        Returns:
+            解析結果の辞書のリスト
+        """
+        results = []
+        offset = 0
+        errors = 0
+        buf_len = len(buf)
+
+        # ループ内の属性参照はローカルに退避
+        parse = self._parse_packet
+        append = results.append
+
+        # memoryview 越しに読む（スライスでコピーしない）。del の前にビューを解放すること
+        with memoryview(buf) as view:
+            while offset < buf_len:
+                result, consumed = parse(view, offset)
+                if not consumed:
+                    break  # フレーム未完成
+                offset += consumed
+
+                if result:
+                    append(result)
+                elif result is None:
+                    errors += 1
+
+        if errors:
+            self.error_count += errors
+        if offset:
+            del buf[:offset]
+        return results
+
+    def _parse_packet(
         self,
-        header_data: bytes,
-        reader: asyncio.StreamReader
-    ) -> Optional[Dict[str, Any]]:
+        buf: memoryview,
+        offset: int
+    ) -> Tuple[Optional[Dict[str, Any]], int]:
         """
         パケット解析
 
         Args:
-            header_data: ヘッダーデータ（15バイトまたは12バイト）
-            reader: 残りのデータを読むためのStreamReader
+            buf: 受信バッファのビュー
+            offset: フレーム先頭位置
 
         Returns:
-            解析結果の辞書、または失敗時None
+            (解析結果の辞書または失敗時None, 消費バイト数)
+            空テキストの場合は (_SKIPPED, 消費バイト数)、フレームが未完成の場合は (None, 0)
         """
         try:
-            header_len = len(header_data)
-
-            # 15バイトヘッダー版を試行
-            if header_len >= 15:
-                try:
-                    command, speed, tone, volume, voice, char_code, msg_length = \
-                        struct.unpack('<HHHHHbi', header_data[:15])
-
-                    logger.debug(
-                        f"📦 15バイトヘッダー: cmd={command:04x} speed={speed} "
-                        f"tone={tone} vol={volume} voice={voice} "
-                        f"char={char_code} len={msg_length}"
-                    )
+            header = parse_header(buf, offset)
+            if header is None:
+                return None, 0
+            command, speed, tone, volume, voice, char_code, msg_length, header_size, protocol_version = header
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "📦 %sヘッダー: cmd=%04x speed=%d tone=%d vol=%d voice=%d char=%d len=%d",
+                    protocol_version, command, speed, tone, volume, voice, char_code, msg_length,
+                )
 
-                    # メッセージ本文読み込み
-                    if msg_length > 0:
-                        text_data = await asyncio.wait_for(
-                            reader.read(msg_length),
-                            timeout=5.0
-                        )
-
-                        # 文字コードでデコード
-                        text = self._decode_text(text_data, char_code)
-
-                        return {
-                            "text": text,
-                            "command": command,
-                            "speed": speed,
-                            "tone": tone,
-                            "volume": volume,
-                            "voice": voice,
-                            "char_code": char_code,
-                            "protocol_version": "15byte"
-                        }
-
-                except struct.error:
-                    pass  # 15バイト版失敗、12バイト版を試行
-
-            # 12バイトヘッダー版を試行
-            if header_len >= 12:
-                try:
-                    command, speed, tone, volume, voice, text_length = \
-                        struct.unpack('<HHHHHH', header_data[:12])
+            if not 0 < msg_length <= _MAX_BODY:
+                # 本文なし／不正な長さ（ヘッダー分だけ読み捨てる）
+                logger.warning("⚠️ パケット解析失敗: cmd=%04x len=%d", command, msg_length)
+                return None, header_size
 
-                    logger.debug(
-                        f"📦 12バイトヘッダー: cmd={command:04x} speed={speed} "
-                        f"tone={tone} vol={volume} voice={voice} len={text_length}"
-                    )
+            end = offset + header_size + msg_length
+            if len(buf) < end:
+                return None, 0
 
-                    # メッセージ本文読み込み
-                    if text_length > 0:
-                        text_data = await asyncio.wait_for(
-                            reader.read(text_length),
-                            timeout=5.0
-                        )
-
-                        # Shift_JISでデコード
-                        text = text_data.decode('shift_jis', errors='ignore')
-
-                        return {
-                            "text": text,
-                            "command": command,
-                            "speed": speed,
-                            "tone": tone,
-                            "volume": volume,
-                            "voice": voice,
-                            "char_code": 2,  # Shift_JIS
-                            "protocol_version": "12byte"
-                        }
-
-                except struct.error as e:
-                    logger.error(f"❌ 12バイトヘッダー解析失敗: {e}")
-
-            # どちらも失敗
-            logger.warning(f"⚠️ パケット解析失敗: header_len={header_len}")
-            return None
+            # 文字コードでデコード（ビューのスライスはコピーなし、bytes 化の1回だけ）
+            text = self._decode_text(bytes(buf[offset + header_size:end]), char_code).strip()
+            if not text:
+                # 空テキスト（MCV の空送信など）は辞書を作らずスキップ
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("📢 空テキストのためスキップ")
+                return _SKIPPED, end - offset
+
+            return {
+                "text": text,
+                "command": command,
+                "speed": speed,
+                "tone": tone,
+                "volume": volume,
+                "voice": voice,
+                "char_code": char_code,
+                "protocol_version": protocol_version
+            }, end - offset
 
         except Exception as e:
             logger.error(f"❌ パケット解析エラー: {e}")
-            return None
+            # 解析不能なデータは破棄して同期を取り直す
+            return None, len(buf) - offset
 
     def _decode_text(self, text_data: bytes, char_code: int) -> str:
         """
@@ -297,79 +429,101 @@ class BouyomiCompatServer:
         Returns:
             デコードされたテキスト
         """
+        # ASCII のみ（通常のチャット）は UTF-8/Shift_JIS どちらでも同じ結果なのでコーデックを通さない
+        if char_code != 1 and text_data.isascii():
+            return text_data.decode('ascii')
+
         try:
-            if char_code == 0:
-                return text_data.decode('utf-8', errors='ignore')
-            elif char_code == 1:
-                return text_data.decode('utf-16le', errors='ignore')
-            else:  # 2 or default
-                return text_data.decode('shift_jis', errors='ignore')
+            # 2 or default は Shift_JIS
+            decode = self._decoders.get(char_code) or self._decoders[2]
+            return decode(text_data, True)
         except Exception as e:
-            logger.warning(f"⚠️ デコードエラー(char_code={char_code}): {e}")
+            logger.warning("⚠️ デコードエラー(char_code=%s): %s", char_code, e)
             # フォールバック: UTF-8で試行
             try:
                 return text_data.decode('utf-8', errors='ignore')
             except:
                 return str(text_data)
 
-    async def _publish_comment(
-        self,
-        parsed: Dict[str, Any],
-        conn_id: int,
-        addr: Any
-    ) -> None:
+    def _build_payload(self, parsed: Dict[str, Any], conn_id: int) -> Dict[str, Any]:
         """
-        解析済みコメントをMessageBusに配信
+        解析結果から ONECOMME_COMMENT 形式の payload を作る
 
         Args:
             parsed: 解析結果
             conn_id: 接続ID
-            addr: クライアントアドレス
+
+        Returns:
+            payload
+        """
+        # タイムスタンプは1回だけ取得
+        now_ms = int(time.time() * 1000)
+
+        # ONECOMME_COMMENT形式（固定値はテンプレートをコピー、parsed のキーは _parse_packet が必ず埋める）
+        data = _DATA_TEMPLATE.copy()
+        data.update(
+            name=f"MCV#{conn_id}",
+            comment=parsed["text"],
+            id="mcv_%d_%d_%d" % (now_ms, conn_id, self.message_count),
+            timestamp=now_ms,
+
+            # デバッグ用: プロトコル情報
+            _bouyomi_speed=parsed["speed"],
+            _bouyomi_tone=parsed["tone"],
+            _bouyomi_volume=parsed["volume"],
+            _bouyomi_voice=parsed["voice"],
+            _bouyomi_protocol=parsed["protocol_version"],
+        )
+        return {"type": "comment", "data": data}
+
+    def _publish_comments(self, results: List[Dict[str, Any]], conn_id: int) -> None:
+        """
+        解析済みコメントをMessageBusに配信
+
+        1件なら ONECOMME_COMMENT、複数なら ONECOMME_COMMENT_BATCH で1回だけ publish する。
+        （BATCH は _ensure_batch_fanout の shim が ONECOMME_COMMENT へ展開し直す）
+
+        Args:
+            results: 解析結果のリスト
+            conn_id: 接続ID
         """
         try:
-            text = parsed.get("text", "").strip()
-            if not text:
-                logger.debug("📢 空テキストのためスキップ")
-                return
-
-            # ONECOMME_COMMENT形式でpublish
-            payload = {
-                "type": "comment",
-                "data": {
-                    "name": f"MCV#{conn_id}",
-                    "comment": text,
-                    "id": f"mcv_{int(time.time() * 1000)}_{conn_id}_{self.message_count}",
-                    "hasGift": False,
-                    "timestamp": int(time.time() * 1000),
-                    "isPinned": False,
-                    "isMembership": False,
-                    "isOwner": False,
-                    "service": "MultiCommentViewer",
-
-                    # デバッグ用: プロトコル情報
-                    "_bouyomi_speed": parsed.get("speed"),
-                    "_bouyomi_tone": parsed.get("tone"),
-                    "_bouyomi_volume": parsed.get("volume"),
-                    "_bouyomi_voice": parsed.get("voice"),
-                    "_bouyomi_protocol": parsed.get("protocol_version"),
-                }
-            }
+            payloads = []
+            for parsed in results:
+                payloads.append(self._build_payload(parsed, conn_id))
+                self.message_count += 1
 
-            # MessageBusに配信
-            self.message_bus.publish(
-                "ONECOMME_COMMENT",
-                payload,
-                sender="bouyomi_compat_server"
-            )
+                text = parsed["text"]
+                logger.info("📨 コメント配信 #%d: '%.50s...'", conn_id, text)
+                self._log_to_bus("info", f"コメント受信: '{text[:30]}...'")
 
-            logger.info(f"📨 コメント配信 #{conn_id}: '{text[:50]}...'")
-            self._log_to_bus("info", f"コメント受信: '{text[:30]}...'")
+            # MessageBusに配信
+            if len(payloads) > 1 and self._batch_fanout:
+                self.message_bus.publish(
+                    ONECOMME_COMMENT_BATCH,
+                    payloads,
+                    sender="bouyomi_compat_server"
+                )
+            else:
+                for payload in payloads:
+                    self.message_bus.publish(
+                        "ONECOMME_COMMENT",
+                        payload,
+                        sender="bouyomi_compat_server"
+                    )
 
         except Exception as e:
             logger.error(f"❌ コメント配信エラー: {e}")
 
     def _log_to_bus(self, level: str, msg: str) -> None:
-        """MessageBusにログ配信"""
+        """MessageBusにログ配信（同じ内容が0.5秒以内に続く場合は捨てる）"""
+        now = time.monotonic()
+        last_ts, last_key = self._last_log
+        key = (level, msg)
+        if key == last_key and now - last_ts < 0.5:
+            return
+        self._last_log = (now, key)
+
         try:
             if self.message_bus:
                 self.message_bus.publish(
@@ -453,6 +607,8 @@ def get_server() -> Optional[BouyomiCompatServer]:
 
 __all__ = [
     "BouyomiCompatServer",
+    "ONECOMME_COMMENT_BATCH",
+    "parse_header",
     "start_server",
     "stop_server",
     "get_server",
@@ -11,7 +11,6 @@ import tkinter as tk
 from tkinter import ttk
 import threading
 import logging
-import time
 import asyncio
 
 logger = logging.getLogger(__name__)
@@ -43,13 +42,15 @@ class ConnectionControlPanel(ttk.Frame):
 
         # 接続状態フラグなど
         self.connected = False
-        self._auto_off_timer = None
+        self._auto_off_timer_id = None  # 4秒自動OFF の after ID
 
         # MessageBus 購読管理
         self._subs = []
 
         # Bouyomi互換サーバー状態
         self.bouyomi_server_running = False
+        # 起動/停止で同じループを使うための常駐イベントループ（初回起動時に生成）
+        self._bouyomi_loop = None
         self._last_status_state = None
         self._last_status_message = None
 
@@ -74,6 +75,9 @@ class ConnectionControlPanel(ttk.Frame):
         # --------------------------------------------------
         self._build_ui()
 
+        # ステータス通知用のログ出力（毎回の hasattr/getattr を避けて一度だけ束縛）
+        self._safe_append = self._append
+
         # --------------------------------------------------
         # 📡 MessageBus イベント購読
         # --------------------------------------------------
@@ -202,31 +206,21 @@ class ConnectionControlPanel(ttk.Frame):
         self.bus.publish("WEBSOCKET_CONNECT", {"url": url}, sender="connection_panel")
 
         # --------------------------------------------------
-        # 🕒 タイムアウト監視（4秒）
+        # 🕒 タイムアウト監視（4秒）: 監視タイマーは常に1本だけ
         # --------------------------------------------------
-        def _check_connect():
-            if not self.connected:
-                self._append("⚠️ 接続確認できず → スイッチ自動OFF")
-                self.var.set(False)
-
-        try:
-            self.after(4000, _check_connect)
-        except Exception:
-            # 予備（通常は使われない）
-            self._auto_off_timer = threading.Thread(
-                target=self._fallback_timer,
-                daemon=True,
-            )
-            self._auto_off_timer.start()
+        self._cancel_auto_off()
+        self._auto_off_timer_id = self.after(4000, self._check_connect)
 
-    def _fallback_timer(self):
-        time.sleep(4)
+    def _check_connect(self):
+        self._auto_off_timer_id = None
         if not self.connected:
-            self._append("⚠️ 接続確認できず（fallback）→ 自動OFF")
-            try:
-                self.var.set(False)
-            except Exception:
-                pass
+            self._append("⚠️ 接続確認できず → スイッチ自動OFF")
+            self.var.set(False)
+
+    def _cancel_auto_off(self):
+        if self._auto_off_timer_id is not None:
+            self.after_cancel(self._auto_off_timer_id)
+            self._auto_off_timer_id = None
 
     def _disconnect_request(self):
         if not self.bus:
@@ -275,12 +269,7 @@ class ConnectionControlPanel(ttk.Frame):
             self._last_status_state = state
             self._last_status_message = combined_msg
 
-            # ログ出力用の安全なヘルパ
-            def _safe_append(text: str):
-                if hasattr(self, "_append") and callable(getattr(self, "_append")):
-                    self._append(text)
-                elif hasattr(self, "_append_log") and callable(getattr(self, "_append_log")):
-                    self._append_log(text)
+            _safe_append = self._safe_append
 
             # トグル用の安全セット
             def _safe_set_var(val: bool):
@@ -293,6 +282,7 @@ class ConnectionControlPanel(ttk.Frame):
             # 状態分岐
             if state == "connected":
                 self.connected = True
+                self._cancel_auto_off()
                 if combined_msg:
                     _safe_append(f"✅ 接続成功 - {combined_msg}")
                 else:
@@ -326,10 +316,7 @@ class ConnectionControlPanel(ttk.Frame):
 
         except Exception as e:
             # ここで例外を握りつぶして“外には出さない”
-            if hasattr(self, "_append") and callable(getattr(self, "_append")):
-                self._append(f"[WS_STATUS handler error suppressed] {e}")
-            elif hasattr(self, "_append_log") and callable(getattr(self, "_append_log")):
-                self._append_log(f"[WS_STATUS handler error suppressed] {e}")
+            self._safe_append(f"[WS_STATUS handler error suppressed] {e}")
 
     def _append(self, text: str):
         try:
@@ -385,35 +372,16 @@ class ConnectionControlPanel(ttk.Frame):
                 except Exception as e:
                     logger.warning(f"⚠️ Bouyomiポート保存失敗: {e}")
 
-            # サーバー起動（非同期）
-            def _async_start():
-                try:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-
-                    server = loop.run_until_complete(
-                        bouyomi_compat_server.start_server(
-                            self.bus,
-                            host="0.0.0.0",
-                            port=port
-                        )
-                    )
-
-                    if server:
-                        self.bouyomi_server_running = True
-                        self.after(0, lambda: self._append(f"✅ Bouyomi互換サーバー起動: port {port}"))
-                    else:
-                        self.bouyomi_server_running = False
-                        self.after(0, lambda: self._append(f"❌ Bouyomi互換サーバー起動失敗"))
-                        self.after(0, lambda: self.bouyomi_var.set(False))
-
-                except Exception as e:
-                    logger.error(f"❌ Bouyomiサーバー起動エラー: {e}")
-                    self.after(0, lambda: self._append(f"❌ Bouyomiサーバー起動エラー: {e}"))
-                    self.after(0, lambda: self.bouyomi_var.set(False))
-
-            th = threading.Thread(target=_async_start, daemon=True)
-            th.start()
+            # サーバー起動（常駐ループに投入）
+            fut = asyncio.run_coroutine_threadsafe(
+                bouyomi_compat_server.start_server(
+                    self.bus,
+                    host="0.0.0.0",
+                    port=port
+                ),
+                self._ensure_bouyomi_loop(),
+            )
+            fut.add_done_callback(lambda f: self._on_bouyomi_start_done(f, port))
 
             self._append(f"🎤 Bouyomi互換サーバー起動中... port {port}")
 
@@ -428,29 +396,64 @@ class ConnectionControlPanel(ttk.Frame):
             return
 
         try:
-            # サーバー停止（非同期）
-            def _async_stop():
-                try:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
+            # 起動時と同じループで停止（別ループだとソケットが閉じられない）
+            if self._bouyomi_loop is None:
+                return
 
-                    loop.run_until_complete(bouyomi_compat_server.stop_server())
+            fut = asyncio.run_coroutine_threadsafe(
+                bouyomi_compat_server.stop_server(),
+                self._bouyomi_loop,
+            )
+            fut.add_done_callback(self._on_bouyomi_stop_done)
 
-                    self.bouyomi_server_running = False
-                    self.after(0, lambda: self._append("🛑 Bouyomi互換サーバー停止"))
+            self._append("🛑 Bouyomi互換サーバー停止中...")
 
-                except Exception as e:
-                    logger.error(f"❌ Bouyomiサーバー停止エラー: {e}")
-                    self.after(0, lambda: self._append(f"❌ 停止エラー: {e}"))
+        except Exception as e:
+            logger.error(f"❌ Bouyomiサーバー停止エラー: {e}")
+            self._append(f"❌ エラー: {e}")
 
-            th = threading.Thread(target=_async_stop, daemon=True)
-            th.start()
+    def _ensure_bouyomi_loop(self) -> asyncio.AbstractEventLoop:
+        """Bouyomiサーバー用の常駐イベントループを返す（無ければスレッドごと起動）"""
+        if self._bouyomi_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever,
+                name="bouyomi_loop",
+                daemon=True,
+            ).start()
+            self._bouyomi_loop = loop
+        return self._bouyomi_loop
 
-            self._append("🛑 Bouyomi互換サーバー停止中...")
+    def _on_bouyomi_start_done(self, fut, port: int):
+        """起動完了（ループスレッドから呼ばれるので UI 更新は after で戻す）"""
+        try:
+            server = fut.result()
+        except Exception as e:
+            logger.error(f"❌ Bouyomiサーバー起動エラー: {e}")
+            self.bouyomi_server_running = False
+            self.after(0, self._append, f"❌ Bouyomiサーバー起動エラー: {e}")
+            self.after(0, lambda: self.bouyomi_var.set(False))
+            return
 
+        if server:
+            self.bouyomi_server_running = True
+            self.after(0, lambda: self._append(f"✅ Bouyomi互換サーバー起動: port {port}"))
+        else:
+            self.bouyomi_server_running = False
+            self.after(0, lambda: self._append("❌ Bouyomi互換サーバー起動失敗"))
+            self.after(0, lambda: self.bouyomi_var.set(False))
+
+    def _on_bouyomi_stop_done(self, fut):
+        """停止完了（ループスレッドから呼ばれる）"""
+        try:
+            fut.result()
         except Exception as e:
             logger.error(f"❌ Bouyomiサーバー停止エラー: {e}")
-            self._append(f"❌ エラー: {e}")
+            self.after(0, self._append, f"❌ 停止エラー: {e}")
+            return
+
+        self.bouyomi_server_running = False
+        self.after(0, lambda: self._append("🛑 Bouyomi互換サーバー停止"))
 
 
 def create_connection_panel(parent, message_bus=None, config_manager=None, **kwargs):
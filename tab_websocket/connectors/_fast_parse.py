@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+_fast_parse - 受信JSON → ONECOMME_COMMENT ペイロード変換
+
+OneCommeLegacy / MultiViewer の受信ごとに呼ばれる変換処理をまとめたモジュールです。
+クロージャや動的属性を使わず、引数・戻り値を型注釈した素の関数だけで構成しているため、
+mypyc 等でそのまま拡張モジュールにコンパイルできます（同名の拡張モジュールがあれば
+Python の import がそちらを優先するため、呼び出し側の変更は不要）。
+"""
+
+from typing import Any, Dict
+
+__all__ = ["build_onecomme_payload", "build_multiviewer_payload", "build_plain_payload"]
+
+
+def build_onecomme_payload(obj: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    OneComme 旧方式の受信JSONから v17.5 拡張payload を組み立てる（各フィールドは1回だけ引く）
+
+    Args:
+        obj: 受信JSON
+
+    Returns:
+        dict: ONECOMME_COMMENT ペイロード
+    """
+    get = obj.get
+    name = get("user") or get("name") or get("author") or "OneComme"
+    text = get("text") or get("message") or get("body") or ""
+    return {
+        "source": "onecomme_legacy",
+        "platform": get("platform", "unknown"),
+        "user_id": get("user_id", ""),
+        "user_name": name,
+        "message": text,
+        "raw": obj,
+        # 後方互換用
+        "text": text,
+        "user": name,
+    }
+
+
+def build_multiviewer_payload(obj: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    マルチコメントビューワーの受信JSONからペイロードを組み立てる（各フィールドは1回だけ引く）
+
+    最小実装: 一般的なフィールドを試行
+    TODO: マルチコメントビューワーの実際のJSONフォーマットに合わせて調整
+
+    Args:
+        obj: 受信JSON
+
+    Returns:
+        dict: ONECOMME_COMMENT ペイロード
+    """
+    # キーの有無で候補を選ぶ（値が空でも先のキーを優先する従来の挙動を維持）
+    name = obj["userName"] if "userName" in obj else obj["user_name"] if "user_name" in obj else obj.get("name", "Unknown")
+    text = obj["comment"] if "comment" in obj else obj["message"] if "message" in obj else obj.get("text", "")
+    return {
+        "source": "multiviewer",
+        "platform": obj["platform"] if "platform" in obj else obj.get("service", "unknown"),
+        "user_id": obj["userId"] if "userId" in obj else obj.get("user_id", ""),
+        "user_name": name,
+        "message": text,
+        "raw": obj,
+        # 後方互換用
+        "text": text,
+        "user": name,
+    }
+
+
+def build_plain_payload(source: str, user_name: str, text: str) -> Dict[str, Any]:
+    """
+    JSONとして扱えない受信データをプレーンテキストのコメントにする
+
+    キー・固定値はいずれもソース上の定数（コンパイル時に intern 済み）なので、
+    受信ごとに新しく確保されるのは本文と raw の空 dict だけです。
+
+    Args:
+        source: 発行元コネクタのタグ（例: "multiviewer"）
+        user_name: 表示名（user / user_name に共通）
+        text: 本文（message / text に共通）
+
+    Returns:
+        dict: ONECOMME_COMMENT ペイロード
+    """
+    return {
+        "source": source,
+        "platform": "unknown",
+        "user_id": "",
+        "user_name": user_name,
+        "message": text,
+        "raw": {},
+        # 後方互換用
+        "text": text,
+        "user": user_name,
+    }
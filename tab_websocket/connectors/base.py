@@ -9,9 +9,134 @@ v17.5 "Multi Comment Bridge" で導入された、複数のコメント取得元
 このクラスを継承し、connect/disconnect メソッドを実装します。
 """
 
+import asyncio
+import inspect
+import json
+import logging
+import threading
+from collections import deque, namedtuple
 from typing import Optional, Callable
 from abc import ABC, abstractmethod
 
+# orjson があれば高速デコーダを使用（bytes をそのまま受け付ける）
+try:
+    import orjson
+    json_loads = orjson.loads
+    _HAS_ORJSON = True
+except Exception:
+    json_loads = json.loads
+    _HAS_ORJSON = False
+
+try:
+    import websockets  # pip install websockets
+    _HAS_WEBSOCKETS = True
+except Exception:
+    _HAS_WEBSOCKETS = False
+
+# WebSocket 系コネクタで共有する asyncio イベントループ（初回利用時にスレッドごと起動）
+_shared_loop: Optional[asyncio.AbstractEventLoop] = None
+_shared_loop_lock = threading.Lock()
+
+
+def get_shared_loop() -> asyncio.AbstractEventLoop:
+    """
+    コネクタ共有のイベントループを返す
+
+    接続ごとにスレッドを立てず、全コネクタの受信をこの1スレッドに多重化します。
+
+    Returns:
+        asyncio.AbstractEventLoop: 常駐スレッドで run_forever 中のループ
+    """
+    global _shared_loop
+    with _shared_loop_lock:
+        if _shared_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever,
+                name="connector_loop",
+                daemon=True,
+            ).start()
+            _shared_loop = loop
+    return _shared_loop
+
+
+async def iter_raw_frames(ws):
+    """
+    WebSocket の受信フレームを順に返す
+
+    websockets が recv(decode=False) に対応していれば、テキストフレームも UTF-8 デコードせず
+    bytes のまま返します（json_loads が bytes を直接受け付けるため、str を経由しない）。
+    切断時は websockets.ConnectionClosed を送出します。
+
+    Args:
+        ws: websockets のクライアント接続
+    """
+    try:
+        raw = "decode" in inspect.signature(ws.recv).parameters
+    except (TypeError, ValueError):
+        raw = False
+
+    if raw:
+        recv = ws.recv
+        while True:
+            yield await recv(decode=False)
+    else:
+        # 旧実装（decode 引数なし）: テキストフレームは str で届く
+        while True:
+            yield await ws.recv()
+
+
+# まとめ送り（level="batch"）の msgs の各要素。1件ずつ dict を組まずタプルで渡す
+WebsocketLog = namedtuple("WebsocketLog", ["level", "msg"])
+
+# WEBSOCKET_LOG のまとめ送り（バースト時も UI 側の追記は一定間隔に抑える）
+_LOG_FLUSH_INTERVAL = 0.05
+_log_queue: deque = deque(maxlen=512)  # (bus, level, msg)。溢れたら古いものから捨てる
+_log_lock = threading.Lock()
+_log_timer: Optional[threading.Timer] = None
+
+
+def _enqueue_ui_log(bus, level: str, msg: str):
+    """WEBSOCKET_LOG をキューに積み、未予約ならフラッシュタイマーを起動"""
+    global _log_timer
+    _log_queue.append((bus, level, msg))
+    with _log_lock:
+        if _log_timer is None:
+            timer = threading.Timer(_LOG_FLUSH_INTERVAL, _flush_ui_logs)
+            timer.daemon = True
+            _log_timer = timer
+            timer.start()
+
+
+def _flush_ui_logs():
+    """
+    溜まったログをバスごとに1回の WEBSOCKET_LOG で発行
+
+    1件だけなら従来形式 {"level", "msg"}、複数件なら {"level": "batch", "msgs": [WebsocketLog, ...]}。
+    """
+    global _log_timer
+    with _log_lock:
+        # 先に予約を外す（以降に積まれたログは次のタイマーで送る）
+        _log_timer = None
+
+    batches = {}
+    while True:
+        try:
+            bus, level, msg = _log_queue.popleft()
+        except IndexError:
+            break
+        batches.setdefault(id(bus), (bus, []))[1].append(WebsocketLog(level, msg))
+
+    for bus, msgs in batches.values():
+        if len(msgs) == 1:
+            payload = {"level": msgs[0].level, "msg": msgs[0].msg}
+        else:
+            payload = {"level": "batch", "msgs": msgs}
+        try:
+            bus.publish("WEBSOCKET_LOG", payload, sender="BaseCommentConnector")
+        except Exception:
+            pass
+
 
 class BaseCommentConnector(ABC):
     """
@@ -21,6 +146,13 @@ class BaseCommentConnector(ABC):
     統一的なインターフェースで接続・切断・状態管理を行います。
     """
 
+    # WEBSOCKET_LOG に付けるプレフィックス（サブクラスで上書き。空ならUIへは転送しない）
+    _UI_LOG_PREFIX = ""
+
+    # WebSocket 切断時に自動再接続するか（指数バックオフ: 1.0s → _BACKOFF_MAX）
+    _RECONNECT = False
+    _BACKOFF_MAX = 10.0
+
     def __init__(self, message_bus, logger):
         """
         Args:
@@ -29,8 +161,20 @@ class BaseCommentConnector(ABC):
         """
         self.message_bus = message_bus
         self.logger = logger
+        # ロガー出力のプレフィックス（クラス名は不変なので1回だけ組み立てる）
+        self._log_prefix = f"[{self.__class__.__name__}] "
         self.connected = False
         self._url = ""
+        # debug ログを WEBSOCKET_LOG としてUIへ転送するか（既定は転送しない）
+        self._ui_debug_enabled = False
+        # debug ログの出力先が1つでもあるか（受信ごとの整形を省くため connect 時にキャッシュ）
+        self._debug_enabled = False
+        # 共有ループ上の受信タスクの状態（_submit_task / _stop_task が管理）
+        self.ws = None
+        self._future = None
+        self._stopped = False
+        # 受信タスクの世代番号（submit / stop ごとに進め、置き換えられた旧タスクの後始末を判別する）
+        self._task_gen = 0
 
     @abstractmethod
     def connect(self, url: str) -> bool:
@@ -87,9 +231,11 @@ class BaseCommentConnector(ABC):
                 - user: str (後方互換用)
         """
         # 後方互換性のため、message → text, user_name → user も設定
-        if "message" in payload and "text" not in payload:
+        # 💡 同梱コネクタは組み立て時にエイリアスを埋めているため、
+        #    "text"/"user" の有無を先に見て 1 回のルックアップで抜ける
+        if "text" not in payload and "message" in payload:
             payload["text"] = payload["message"]
-        if "user_name" in payload and "user" not in payload:
+        if "user" not in payload and "user_name" in payload:
             payload["user"] = payload["user_name"]
 
         self.message_bus.publish(
@@ -120,6 +266,45 @@ class BaseCommentConnector(ABC):
             sender=self.__class__.__name__,
         )
 
+    def set_ui_debug(self, enabled: bool):
+        """
+        debug ログのUI転送を切り替え
+
+        Args:
+            enabled: True で debug レベルも WEBSOCKET_LOG として発行
+        """
+        self._ui_debug_enabled = bool(enabled)
+        self._refresh_debug_enabled()
+
+    def _refresh_debug_enabled(self):
+        """debug ログの要否（logger の DEBUG 有効 or UI 転送有効）を再判定してキャッシュ"""
+        self._debug_enabled = self._ui_debug_enabled or self._is_debug_enabled()
+
+    def _is_debug_enabled(self) -> bool:
+        """
+        debug ログが出力されるか（重い整形をする前の判定用）
+
+        Returns:
+            bool: logger が DEBUG を出力する場合True（判定できない logger は True）
+        """
+        is_enabled_for = getattr(self.logger, "isEnabledFor", None)
+        if is_enabled_for is None:
+            return True
+        return is_enabled_for(logging.DEBUG)
+
+    def _publish_ui_log(self, level: str, message: str):
+        """
+        WEBSOCKET_LOG（connection_panel のログ表示）へ送る
+
+        即時には発行せず、_LOG_FLUSH_INTERVAL ごとにまとめて発行します。
+
+        Args:
+            level: ログレベル
+            message: 表示メッセージ（コネクタ名のプレフィックス込み）
+        """
+        if self.message_bus is not None:
+            _enqueue_ui_log(self.message_bus, level, message)
+
     def _log(self, level: str, message: str):
         """
         ログ出力
@@ -130,4 +315,161 @@ class BaseCommentConnector(ABC):
         """
         log_method = getattr(self.logger, level, None)
         if log_method:
-            log_method(f"[{self.__class__.__name__}] {message}")
+            log_method(self._log_prefix + message)
+
+        if not self._UI_LOG_PREFIX:
+            return
+
+        # debug はUI転送が有効な時だけ発行（受信ごとの recv-raw でバスを埋めないように）
+        if level == "debug" and not self._ui_debug_enabled:
+            return
+
+        # WEBSOCKET_LOG イベント発行（connection_panel が購読）
+        self._publish_ui_log(level, self._UI_LOG_PREFIX + message)
+
+    # ------------------------------------------------------------
+    # 共有イベントループ上の受信タスク（WebSocket 系 / TCPクライアント）
+    # ------------------------------------------------------------
+    def _submit_task(self, coro_func: Callable):
+        """
+        既存の受信タスクを止めてから、coro_func(gen) を共有イベントループに投入
+
+        キャンセルされた旧タスクの finally は新タスクの開始後に走ることがあるため、
+        タスクには世代番号を渡し、後始末で状態を発行してよいかを判定させます。
+
+        Args:
+            coro_func: 受信ループのコルーチン関数（引数は世代番号 gen）
+        """
+        # 既存の接続があれば停止
+        if self._future and not self._future.done():
+            self.disconnect()
+
+        # 接続開始
+        self._task_gen += 1
+        self._stopped = False
+        self._refresh_debug_enabled()
+        self._future = asyncio.run_coroutine_threadsafe(coro_func(self._task_gen), get_shared_loop())
+
+    def _stop_task(self):
+        """受信タスクを停止して disconnected を発行"""
+        self._task_gen += 1
+        self._stopped = True
+        self.connected = False
+
+        # 受信タスクをキャンセル（ソケット / WebSocket はタスク側で閉じられる）
+        try:
+            if self._future and not self._future.done():
+                self._future.cancel()
+        except Exception:
+            pass
+
+        try:
+            self._publish_status("disconnected")
+        except Exception:
+            pass
+
+    # ------------------------------------------------------------
+    # WebSocket 系コネクタ共通（OneComme旧 / マルチコメントビューワー / 任意URL）
+    # ------------------------------------------------------------
+    def _start_ws(self) -> bool:
+        """
+        self._url への受信タスクを共有イベントループに投入
+
+        Returns:
+            bool: 接続開始に成功した場合True
+        """
+        if not _HAS_WEBSOCKETS:
+            self._log("error", "websockets がインストールされていません")
+            self._publish_status("error", error="websockets not installed")
+            return False
+
+        self._submit_task(self._ws_runner)
+        return True
+
+    async def _ws_runner(self, gen: int):
+        """
+        接続・受信・再接続バックオフ（共有ループ上で実行）
+
+        Args:
+            gen: _submit_task が割り当てた世代番号（置き換え後は状態を発行しない）
+        """
+        backoff = 1.0
+        while gen == self._task_gen:
+            try:
+                async with websockets.connect(self._url, ping_interval=20, ping_timeout=10) as ws:
+                    self.ws = ws
+                    self._log("info", f"connected: {self._url}")
+                    self._publish_status("connected")
+                    self.connected = True
+                    # 接続できたらバックオフをリセット
+                    backoff = 1.0
+
+                    # 受信ごとの属性ルックアップを省くため、ループの外で束縛しておく
+                    dispatch = self._dispatch
+                    try:
+                        async for message in iter_raw_frames(ws):
+                            dispatch(message)
+                    except websockets.ConnectionClosed:
+                        pass
+
+                if gen == self._task_gen:
+                    self._log("info", f"disconnected: code={ws.close_code} msg={ws.close_reason}")
+                    self._publish_status("disconnected")
+            except asyncio.CancelledError:
+                # disconnect() による停止（状態は disconnect 側で発行済み）
+                raise
+            except Exception as e:
+                if gen == self._task_gen:
+                    self._log("error", f"{e}")
+                    self._publish_status("error", error=str(e))
+            finally:
+                # 新しいタスクに置き換わっていれば、その接続状態には触れない
+                if gen == self._task_gen:
+                    self.ws = None
+                    self.connected = False
+
+            # 停止指示（または新タスクへの置き換え）があればループ抜け
+            if gen != self._task_gen or not self._RECONNECT:
+                break
+
+            # 再接続バックオフ
+            sleep_sec = min(backoff, self._BACKOFF_MAX)
+            self._log("info", f"reconnect in {sleep_sec:.1f}s")
+            await asyncio.sleep(sleep_sec)
+            backoff = min(backoff * 2, self._BACKOFF_MAX)
+
+    def _parse_frame(self, message) -> dict:
+        """
+        受信フレームをコメントペイロードに変換（WebSocket 系サブクラスで実装）
+
+        Args:
+            message: 受信データ（テキストフレームは str、バイナリフレームは bytes）
+
+        Returns:
+            dict: _publish_comment に渡すペイロード
+        """
+        raise NotImplementedError("_parse_frame() must be implemented by subclass")
+
+    def _dispatch(self, message):
+        """
+        受信メッセージを解析してコメントとして発行
+
+        Args:
+            message: 受信データ（テキストフレームは str、バイナリフレームは bytes）
+        """
+        try:
+            # 生payloadログ（トラブル時の可視化。出力先が無ければ整形もしない）
+            if self._debug_enabled:
+                self._log("debug", f"recv-raw: {message[:200]!s}")
+
+            payload = self._parse_frame(message)
+
+            self._log("info", f"recv-parsed: text='{(payload.get('message') or '')[:80]}' user='{payload.get('user_name','')}'")
+
+            if payload and (payload.get("message") or "").strip():
+                self._publish_comment(payload)
+            elif self._debug_enabled:
+                self._log("debug", "recv(no-text): skip")
+
+        except Exception as e:
+            self._log("error", f"message handler error: {e}")
@@ -16,13 +16,75 @@ BouyomiCompatServerConnector - 棒読みちゃん互換TCPサーバ
   ※今回は最小実装として、テキスト部分の取得に集中
 """
 
+import selectors
 import socket
 import struct
 import threading
-import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
-from urllib.parse import parse_qs, urlparse
-from .base import BaseCommentConnector
+from urllib.parse import unquote_plus
+from .base import BaseCommentConnector, json_loads
+
+# 棒読みちゃん 15バイトヘッダー: Command(2) + Speed(2) + Tone(2) + Volume(2) + Voice(2) + Encoding(1) + Length(4)
+_BOUYOMI_HDR = struct.Struct("<HhhhhBI")
+
+# HTTPレスポンスヘッダーのテンプレート（bytes のまま % で埋める）
+_RESPONSE_HEADER = (
+    b"HTTP/1.1 %d %s\r\n"
+    b"Content-Type: %s; charset=utf-8\r\n"
+    b"Content-Length: %d\r\n"
+    b"Connection: close\r\n"
+    b"\r\n"
+)
+
+# HTTP とみなすリクエスト先頭（空白まで含めてバイナリヘッダとの誤判定を防ぐ）
+_HTTP_METHOD_PREFIXES = (b"GET ", b"POST ")
+# プロトコル判定のために先読みするバイト数（棒読みちゃんヘッダ長より短いこと）
+_SNIFF_SIZE = 5
+
+# 棒読みちゃんヘッダの文字コード番号 → コーデック名（0: UTF-8, 1: Unicode, 2: Shift_JIS）
+_ENCODINGS = {0: "utf-8", 1: "utf-16-le", 2: "shift_jis"}
+
+def _query_param(query: str, name: str) -> Optional[str]:
+    """
+    クエリ文字列から最初の name の値を取り出す（1パスでパーセントデコード）
+
+    Returns:
+        str: 値（パラメータが無い場合はNone）
+    """
+    for pair in query.split("&"):
+        key, _, value = pair.partition("=")
+        if unquote_plus(key) == name:
+            return unquote_plus(value)
+    return None
+
+
+# scatter-gather 送信の可否（Windows の socket には sendmsg が無い）
+_HAS_SENDMSG = hasattr(socket.socket, "sendmsg")
+
+
+def _sendmsg_all(sock: socket.socket, header: bytes, body: bytes):
+    """ヘッダとボディを sendmsg で送り切る（部分送信時は残りから再送）"""
+    buffers = [memoryview(header), memoryview(body)]
+    while buffers:
+        sent = sock.sendmsg(buffers)
+        # 送信済みバイト数だけバッファ列を先頭から消費
+        while buffers and sent >= len(buffers[0]):
+            sent -= len(buffers[0])
+            buffers.pop(0)
+        if buffers and sent:
+            buffers[0] = buffers[0][sent:]
+
+
+# 同時に処理するクライアント数の上限
+_MAX_CLIENT_WORKERS = 32
+
+# 受信ソケットバッファサイズ
+_RCVBUF_SIZE = 256 * 1024
+
+# HTTP リクエストの1行の最大長と、読むヘッダー行数の上限
+_MAX_HTTP_LINE = 4096
+_MAX_HTTP_HEADERS = 100
 
 
 class BouyomiCompatServerConnector(BaseCommentConnector):
@@ -33,13 +95,22 @@ class BouyomiCompatServerConnector(BaseCommentConnector):
     マルチコメントビューワーなどから送られてくるテキストを受信します。
     """
 
+    # WEBSOCKET_LOG に付けるプレフィックス（ログごとに f-string を組まない）
+    _UI_LOG_PREFIX = "[MCV Bouyomi] "
+
     def __init__(self, message_bus, logger):
         super().__init__(message_bus, logger)
         self.port = 50010  # デフォルトポート
         self.server_socket: Optional[socket.socket] = None
         self._server_thread: Optional[threading.Thread] = None
+        # 待受ループへの停止通知（socketpair の書き込み側）
+        self._wakeup_w: Optional[socket.socket] = None
         self._stopped = False
-        self._client_threads = []
+        # クライアント処理用スレッドプール（接続ごとのスレッド生成をやめ、同時処理数に上限を設ける）
+        self._pool: Optional[ThreadPoolExecutor] = None
+        # 処理中のクライアントソケット（停止時に閉じて recv 待ちのワーカーを解放する）
+        self._client_sockets = set()
+        self._client_lock = threading.Lock()
 
     def connect(self, port: int = 50010) -> bool:
         """
@@ -63,6 +134,7 @@ class BouyomiCompatServerConnector(BaseCommentConnector):
 
         # サーバ起動
         self._stopped = False
+        self._refresh_debug_enabled()
         try:
             self._start_server()
             self._log("info", f"🛰 待受開始: 0.0.0.0:{self.port}")
@@ -79,19 +151,26 @@ class BouyomiCompatServerConnector(BaseCommentConnector):
         self._stopped = True
         self.connected = False
 
-        # サーバソケットを閉じる
-        if self.server_socket:
+        # 待受ループを起こして終了させる（サーバソケットはループ側で閉じる）
+        if self._wakeup_w:
             try:
-                self.server_socket.close()
+                self._wakeup_w.send(b"x")
             except Exception:
                 pass
-            self.server_socket = None
+            self._wakeup_w = None
+        self.server_socket = None
 
-        # クライアントスレッドの終了を待つ（タイムアウト付き）
-        for thread in self._client_threads:
-            if thread.is_alive():
-                thread.join(timeout=1.0)
-        self._client_threads.clear()
+        # 処理中のクライアントを切断し、プールを停止（未着手の接続は破棄）
+        with self._client_lock:
+            client_sockets = list(self._client_sockets)
+        for sock in client_sockets:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except Exception:
+                pass
+        if self._pool:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
 
         self._log("info", "🛑 待受停止")
         self._publish_status("disconnected")
@@ -100,47 +179,70 @@ class BouyomiCompatServerConnector(BaseCommentConnector):
         """TCPサーバを起動（別スレッドで実行）"""
 
         def _server_loop():
+            sel = selectors.DefaultSelector()
+            server_socket = None
             try:
                 # ソケット作成
-                self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-                self.server_socket.bind(("0.0.0.0", self.port))
-                self.server_socket.listen(5)
-                self.server_socket.settimeout(1.0)  # accept のタイムアウト
+                server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                self.server_socket = server_socket
+                server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                # 受信バッファを広げ、1回の recv でまとめて受け取れるようにする（accept したソケットに継承）
+                server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _RCVBUF_SIZE)
+                server_socket.bind(("0.0.0.0", self.port))
+                # MCV の再接続が集中しても取りこぼさないよう、待ち行列は OS 上限まで確保
+                server_socket.listen(socket.SOMAXCONN)
+                server_socket.setblocking(False)
+
+                # 接続待ちと停止通知の両方を select で待つ（タイムアウトで起き続けない）
+                sel.register(server_socket, selectors.EVENT_READ)
+                sel.register(wakeup_r, selectors.EVENT_READ)
 
                 self._log("info", f"🔌 TCPサーバ起動: ポート {self.port}")
 
                 while not self._stopped:
-                    try:
-                        client_socket, addr = self.server_socket.accept()
+                    for key, _ in sel.select():
+                        if key.fileobj is wakeup_r:
+                            return  # disconnect() からの停止通知
+
+                        try:
+                            client_socket, addr = server_socket.accept()
+                        except BlockingIOError:
+                            continue  # 他で処理済み／接続が取り消された
+                        except Exception as e:
+                            if not self._stopped:
+                                self._log("error", f"❌ accept エラー: {e}")
+                            continue
+
+                        # 待受ソケットのノンブロッキング設定を引き継ぐ OS があるため明示的に戻す
+                        client_socket.setblocking(True)
+                        # 小さな HTTP 応答が Nagle で遅延しないように
+                        client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
                         self._log("info", f"📥 クライアント接続: {addr}")
 
-                        # クライアント処理スレッドを起動
-                        client_thread = threading.Thread(
-                            target=self._handle_client,
-                            args=(client_socket, addr),
-                            daemon=True,
-                        )
-                        client_thread.start()
-                        self._client_threads.append(client_thread)
-
-                    except socket.timeout:
-                        # タイムアウトは正常（ループ継続）
-                        continue
-                    except Exception as e:
-                        if not self._stopped:
-                            self._log("error", f"❌ accept エラー: {e}")
+                        # クライアント処理をプールに投入
+                        pool.submit(self._handle_client, client_socket, addr)
 
             except Exception as e:
-                self._log("error", f"❌ サーバループエラー: {e}")
-                self._publish_status("error", error=str(e))
+                if not self._stopped:
+                    self._log("error", f"❌ サーバループエラー: {e}")
+                    self._publish_status("error", error=str(e))
             finally:
-                if self.server_socket:
-                    try:
-                        self.server_socket.close()
-                    except Exception:
-                        pass
+                sel.close()
+                for sock in (server_socket, wakeup_r, wakeup_w):
+                    if sock:
+                        try:
+                            sock.close()
+                        except Exception:
+                            pass
+
+        # 停止通知用のソケットペア（Windows でも select 可能）
+        wakeup_r, wakeup_w = socket.socketpair()
+        self._wakeup_w = wakeup_w
 
+        self._pool = pool = ThreadPoolExecutor(
+            max_workers=_MAX_CLIENT_WORKERS,
+            thread_name_prefix="bouyomi",
+        )
         self._server_thread = threading.Thread(target=_server_loop, daemon=True)
         self._server_thread.start()
 
@@ -152,111 +254,87 @@ class BouyomiCompatServerConnector(BaseCommentConnector):
             client_socket: クライアントソケット
             addr: クライアントアドレス
         """
+        with self._client_lock:
+            self._client_sockets.add(client_socket)
+
         try:
-            # 最初の数バイトを覗き見（peekで非破壊読み込み）
-            try:
-                first_bytes = client_socket.recv(4, socket.MSG_PEEK)
-                if not first_bytes:
-                    return
-            except Exception as e:
-                self._log("debug", f"初期データ読み込みエラー: {e}")
+            # 先頭数バイトを読み込んで判定（MSG_PEEK で二重にコピーさせず、各ハンドラへ引き継ぐ）
+            prefix = self._recv_exact(client_socket, _SNIFF_SIZE)
+            if not prefix:
                 return
 
-            # HTTPリクエストか判定（GET / POST で始まるか）
-            if first_bytes.startswith(b'GET ') or first_bytes.startswith(b'POST'):
+            # HTTPリクエストか判定（"GET " / "POST " で始まるか）
+            if prefix.startswith(_HTTP_METHOD_PREFIXES):
                 self._log("debug", f"🌐 HTTPリクエスト検出: {addr}")
-                self._handle_http_request(client_socket, addr)
+                self._handle_http_request(client_socket, addr, prefix)
             else:
                 self._log("debug", f"📦 TCPバイナリプロトコル検出: {addr}")
-                self._handle_tcp_binary(client_socket, addr)
+                self._handle_tcp_binary(client_socket, addr, prefix)
 
         except Exception as e:
             self._log("error", f"❌ クライアント処理エラー: {e}")
         finally:
+            with self._client_lock:
+                self._client_sockets.discard(client_socket)
             try:
                 client_socket.close()
             except Exception:
                 pass
             self._log("debug", f"📤 クライアント切断: {addr}")
 
-    def _handle_http_request(self, client_socket: socket.socket, addr: tuple):
+    def _handle_http_request(self, client_socket: socket.socket, addr: tuple, prefix: bytes = b""):
         """
         HTTP リクエストを処理（GET/POST対応）
 
         Args:
             client_socket: クライアントソケット
             addr: クライアントアドレス
+            prefix: プロトコル判定で読み込み済みのリクエスト先頭
         """
         try:
-            # HTTPヘッダーを読み込み（\r\n\r\n まで）
-            header_data = b""
-            while True:
-                chunk = client_socket.recv(1024)
-                if not chunk:
-                    break
-                header_data += chunk
-                # HTTPヘッダー終了（\r\n\r\n）を検出
-                if b"\r\n\r\n" in header_data:
-                    break
-                # タイムアウト防止（最大8KB）
-                if len(header_data) > 8192:
-                    break
+            # バッファ付きファイルとして1行ずつ読む（受信済みデータを何度も走査しない）
+            with client_socket.makefile("rb", buffering=8192) as rfile:
+                # リクエストラインを解析（判定用に読んだ先頭と続きを連結）
+                line = prefix
+                if not line.endswith(b"\n"):
+                    line += rfile.readline(_MAX_HTTP_LINE - len(prefix))
+                request_line = line.decode("utf-8", errors="ignore").rstrip("\r\n")
+                if not request_line:
+                    return
 
-            # ヘッダーとボディを分離
-            if b"\r\n\r\n" in header_data:
-                header_part, body_part = header_data.split(b"\r\n\r\n", 1)
-            else:
-                header_part = header_data
-                body_part = b""
+                # ヘッダー（キーは小文字の bytes）
+                headers = {}
+                for _ in range(_MAX_HTTP_HEADERS):
+                    line = rfile.readline(_MAX_HTTP_LINE)
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    key, _, value = line.partition(b":")
+                    headers[key.strip().lower()] = value.strip()
 
-            # ヘッダーをデコード
-            try:
-                header_text = header_part.decode("utf-8", errors="ignore")
-            except Exception:
-                self._log("error", "❌ HTTPヘッダーのデコード失敗")
-                return
+                self._log("info", f"🌐 HTTP: {request_line}")
 
-            # リクエストラインを解析
-            lines = header_text.split("\r\n")
-            if not lines:
-                return
+                # メソッドとパスを抽出
+                parts = request_line.split()
+                if len(parts) < 2:
+                    self._send_http_response(client_socket, 400, "Bad Request")
+                    return
 
-            request_line = lines[0]
-            self._log("info", f"🌐 HTTP: {request_line}")
+                method = parts[0].upper()
+                path_with_query = parts[1]
 
-            # メソッドとパスを抽出
-            parts = request_line.split()
-            if len(parts) < 2:
-                self._send_http_response(client_socket, 400, "Bad Request")
-                return
+                # パスとクエリを分離（/Talk?text=... しか使わないので urlparse は通さない）
+                path, _, query = path_with_query.partition("?")
 
-            method = parts[0].upper()
-            path_with_query = parts[1]
-
-            # パースURLからパスとクエリを分離
-            parsed = urlparse(path_with_query)
-            path = parsed.path
-            query_params = parse_qs(parsed.query)
-
-            # Content-Lengthを取得（POSTの場合）
-            content_length = 0
-            for line in lines[1:]:
-                if line.lower().startswith("content-length:"):
-                    try:
-                        content_length = int(line.split(":", 1)[1].strip())
-                    except ValueError:
-                        pass
-                    break
+                # Content-Lengthを取得（POSTの場合）
+                try:
+                    content_length = int(headers.get(b"content-length", b"0"))
+                except ValueError:
+                    content_length = 0
 
-            # POSTの場合、ボディを読み込み
-            if method == "POST" and content_length > 0:
-                # 既に読み込んだボディ部分の長さを確認
-                remaining = content_length - len(body_part)
-                if remaining > 0:
-                    # 残りのボディを読み込み
-                    additional_body = self._recv_exact(client_socket, remaining)
-                    if additional_body:
-                        body_part += additional_body
+                # POSTの場合、ボディを読み込み
+                body_part = b""
+                if method == "POST" and content_length > 0:
+                    body_part = rfile.read(content_length)
 
             # エンドポイント処理
             if path == "/getvoicelist":
@@ -266,7 +344,7 @@ class BouyomiCompatServerConnector(BaseCommentConnector):
                 if method == "POST":
                     self._handle_talk_post(client_socket, addr, body_part)
                 else:
-                    self._handle_talk_get(client_socket, addr, query_params)
+                    self._handle_talk_get(client_socket, addr, query)
             else:
                 self._log("warning", f"⚠️ 未知のエンドポイント: {path}")
                 self._send_http_response(client_socket, 404, "Not Found")
@@ -293,23 +371,22 @@ class BouyomiCompatServerConnector(BaseCommentConnector):
         response_body = "\n".join(voice_list)
         self._send_http_response(client_socket, 200, "OK", response_body, content_type="text/plain; charset=utf-8")
 
-    def _handle_talk_get(self, client_socket: socket.socket, addr: tuple, query_params: dict):
+    def _handle_talk_get(self, client_socket: socket.socket, addr: tuple, query: str):
         """
         GET /Talk エンドポイント（接続テストボタン用）
 
         Args:
             client_socket: クライアントソケット
             addr: クライアントアドレス
-            query_params: クエリパラメータ
+            query: クエリ文字列（"?" より後ろ）
         """
         # text パラメータを取得
-        text_list = query_params.get("text", [])
-        if not text_list:
+        text = _query_param(query, "text")
+        if text is None:
             self._log("warning", "⚠️ GET /Talk: text パラメータなし")
             self._send_http_response(client_socket, 400, "Bad Request")
             return
 
-        text = text_list[0]  # 最初の値を取得
         if not text:
             self._log("warning", "⚠️ GET /Talk: text が空")
             self._send_http_response(client_socket, 400, "Bad Request")
@@ -331,9 +408,8 @@ class BouyomiCompatServerConnector(BaseCommentConnector):
             body_data: POSTボディ（JSON）
         """
         try:
-            # JSONをパース
-            body_text = body_data.decode("utf-8", errors="ignore")
-            data = json.loads(body_text)
+            # JSONをパース（bytes のまま渡し、UTF-8 検証もデコーダに任せる）
+            data = json_loads(body_data)
 
             # text フィールドを取得
             text = data.get("text", "")
@@ -348,7 +424,8 @@ class BouyomiCompatServerConnector(BaseCommentConnector):
             # 200 OK を返す
             self._send_http_response(client_socket, 200, "OK")
 
-        except json.JSONDecodeError as e:
+        except ValueError as e:
+            # json.JSONDecodeError / orjson.JSONDecodeError / UnicodeDecodeError はいずれも ValueError
             self._log("error", f"❌ POST /Talk: JSON解析エラー: {e}")
             self._send_http_response(client_socket, 400, "Bad Request - Invalid JSON")
         except Exception as e:
@@ -368,47 +445,63 @@ class BouyomiCompatServerConnector(BaseCommentConnector):
         """
         try:
             body_bytes = body.encode("utf-8")
-            response = (
-                f"HTTP/1.1 {status_code} {status_text}\r\n"
-                f"Content-Type: {content_type}; charset=utf-8\r\n"
-                f"Content-Length: {len(body_bytes)}\r\n"
-                f"Connection: close\r\n"
-                "\r\n"
-            ).encode("utf-8") + body_bytes
-
-            client_socket.sendall(response)
+            header = _RESPONSE_HEADER % (
+                status_code,
+                status_text.encode("utf-8"),
+                content_type.encode("utf-8"),
+                len(body_bytes),
+            )
+
+            if body_bytes and _HAS_SENDMSG:
+                # ヘッダとボディを連結せず 1 回の sendmsg で送る（部分送信はループで継続）
+                _sendmsg_all(client_socket, header, body_bytes)
+            else:
+                # Windows には sendmsg が無いため従来どおり連結して sendall
+                client_socket.sendall(header + body_bytes)
         except Exception as e:
             self._log("error", f"❌ HTTPレスポンス送信エラー: {e}")
 
-    def _handle_tcp_binary(self, client_socket: socket.socket, addr: tuple):
+    def _handle_tcp_binary(self, client_socket: socket.socket, addr: tuple, prefix: bytes = b""):
         """
         TCPバイナリプロトコル（従来の棒読みちゃんプロトコル）を処理
 
         Args:
             client_socket: クライアントソケット
             addr: クライアントアドレス
+            prefix: プロトコル判定で読み込み済みの最初のヘッダ先頭
         """
+        # デバッグ出力の要否（logger の DEBUG or UI 転送。無効時は hex 等の整形自体をしない）
+        dbg = self._debug_enabled
+        # 同一接続で連続受信するため、ペイロード雛形は1回だけ作る
+        template = self._comment_template(addr)
+
         try:
             while not self._stopped:
                 # まず15バイト読み込み（標準の棒読みちゃんプロトコル）
                 try:
-                    header_15 = self._recv_exact(client_socket, 15)
-                    if not header_15:
+                    # 最初のヘッダだけは判定時に読んだ先頭バイトの続きを受信
+                    rest = self._recv_exact(client_socket, _BOUYOMI_HDR.size - len(prefix))
+                    if not rest:
                         break  # 接続終了
+                    header_15 = prefix + rest if prefix else rest
+                    prefix = b""
                 except Exception as e:
-                    self._log("debug", f"ヘッダ読み込みエラー: {e}")
+                    if dbg:
+                        self._log("debug", f"ヘッダ読み込みエラー: {e}")
                     break
 
                 # デバッグ: 受信した生データを16進ダンプ
-                self._log("debug", f"🔍 受信データ(hex): {header_15.hex()}")
-                self._log("debug", f"🔍 受信データ(ascii): {header_15[:15]}")
+                if dbg:
+                    self._log("debug", f"🔍 受信データ(hex): {header_15.hex()}")
+                    self._log("debug", f"🔍 受信データ(ascii): {header_15[:15]}")
 
                 try:
                     # 15バイトヘッダー版として解析
                     # Command(2) + Speed(2) + Tone(2) + Volume(2) + Voice(2) + Encoding(1) + Length(4)
-                    command, speed, tone, volume, voice, encoding, text_length = struct.unpack("<HhhhhBI", header_15)
+                    command, speed, tone, volume, voice, encoding, text_length = _BOUYOMI_HDR.unpack_from(header_15)
 
-                    self._log("debug", f"📦 15バイトヘッダー: cmd={command:04x} enc={encoding} len={text_length}")
+                    if dbg:
+                        self._log("debug", f"📦 15バイトヘッダー: cmd={command:04x} enc={encoding} len={text_length}")
 
                     # 長さチェック
                     if text_length > 10000 or text_length < 0:
@@ -418,33 +511,27 @@ class BouyomiCompatServerConnector(BaseCommentConnector):
                     # テキストデータを読み込み
                     text_bytes = self._recv_exact(client_socket, text_length)
                     if not text_bytes:
-                        self._log("debug", f"⚠️ テキストデータ読み込み失敗: length={text_length}")
+                        if dbg:
+                            self._log("debug", f"⚠️ テキストデータ読み込み失敗: length={text_length}")
                         break
 
                     # デバッグ: 受信データの16進ダンプ
-                    self._log("debug", f"📦 受信データ: {text_bytes.hex()} (encoding={encoding}, len={len(text_bytes)})")
-
-                    # エンコーディング判定
-                    # 0: UTF-8, 1: Unicode, 2: Shift_JIS
-                    if encoding == 0:
-                        text = text_bytes.decode("utf-8", errors="ignore")
-                    elif encoding == 2:
-                        text = text_bytes.decode("shift_jis", errors="ignore")
-                    else:
-                        # Unicode（UTF-16LE）または不明な場合はUTF-8でフォールバック
-                        try:
-                            text = text_bytes.decode("utf-16-le", errors="ignore")
-                        except Exception:
-                            text = text_bytes.decode("utf-8", errors="ignore")
+                    if dbg:
+                        self._log("debug", f"📦 受信データ: {text_bytes.hex()} (encoding={encoding}, len={len(text_bytes)})")
 
-                    self._log("debug", f"📝 デコード結果: '{text}' (len={len(text)})")
+                    # エンコーディング判定（1: Unicode および不明値は UTF-16LE）
+                    text = text_bytes.decode(_ENCODINGS.get(encoding, "utf-16-le"), errors="ignore")
+
+                    if dbg:
+                        self._log("debug", f"📝 デコード結果: '{text}' (len={len(text)})")
 
                     text = text.strip()
-                    self._log("debug", f"✂️ strip後: '{text}' (len={len(text)})")
+                    if dbg:
+                        self._log("debug", f"✂️ strip後: '{text}' (len={len(text)})")
 
                     if text:
                         self._log("info", f"💬 受信: {text[:100]}")
-                        self._publish_comment_event(text, addr)
+                        self._publish_comment_event(text, addr, template)
                     else:
                         self._log("warning", f"⚠️ テキストが空です（strip後）")
 
@@ -469,57 +556,59 @@ class BouyomiCompatServerConnector(BaseCommentConnector):
         Returns:
             bytes: 受信データ（失敗時はNone）
         """
-        data = b""
-        while len(data) < length:
+        # 受信先を最初に確保し、recv_into で直接書き込む（連結によるコピーをしない）
+        buf = bytearray(length)
+        view = memoryview(buf)
+        got = 0
+        while got < length:
             try:
-                chunk = sock.recv(length - len(data))
-                if not chunk:
+                n = sock.recv_into(view[got:])
+                if not n:
                     return None  # 接続終了
-                data += chunk
+                got += n
             except Exception:
                 return None
-        return data
+        return bytes(buf)
 
-    def _publish_comment_event(self, text: str, addr: tuple):
+    @staticmethod
+    def _comment_template(addr: tuple) -> dict:
         """
-        受信したテキストをコメントイベントとして発行
+        接続元ごとに不変なコメントペイロードの雛形を作成
 
         Args:
-            text: 受信テキスト
             addr: クライアントアドレス
+
+        Returns:
+            dict: message / text 以外を埋めたペイロード
         """
-        payload = {
+        return {
             "source": "multi_comment_viewer",
             "platform": "unknown",
             "user_id": "",
             "user_name": "MCV",
-            "message": text,
             "raw": {
                 "protocol": "bouyomi_compat",
                 "remote_addr": f"{addr[0]}:{addr[1]}",
             },
             # 後方互換用
-            "text": text,
             "user": "MCV",
         }
 
-        self._publish_comment(payload)
-
-    def _log(self, level: str, message: str):
+    def _publish_comment_event(self, text: str, addr: tuple, template: Optional[dict] = None):
         """
-        ログ出力（BaseCommentConnector をオーバーライド）
+        受信したテキストをコメントイベントとして発行
 
-        WEBSOCKET_LOG イベントも発行して、connection_panel のログに表示します。
+        Args:
+            text: 受信テキスト
+            addr: クライアントアドレス
+            template: _comment_template() の雛形（同一接続で使い回す場合に指定）
         """
-        # 親クラスのログ出力
-        super()._log(level, message)
+        if template is None:
+            template = self._comment_template(addr)
 
-        # WEBSOCKET_LOG イベント発行（connection_panel が購読）
-        try:
-            self.message_bus.publish(
-                "WEBSOCKET_LOG",
-                {"level": level, "msg": f"[MCV Bouyomi] {message}"},
-                sender=self.__class__.__name__,
-            )
-        except Exception:
-            pass
+        # 雛形はスレッド（接続）ごとのローカル変数なので、コピーして本文だけ差し込む
+        payload = template.copy()
+        payload["message"] = text
+        payload["text"] = text
+
+        self._publish_comment(payload)
@@ -11,16 +11,57 @@ ManualConnector - 任意URL接続
 - 不明なフォーマットでも基本的な処理を試行
 """
 
-import threading
-import json
-import time
-from .base import BaseCommentConnector
+from .base import BaseCommentConnector, json_loads
+from ._fast_parse import build_plain_payload
 
-try:
-    import websocket
-    _HAS_WS = True
-except Exception:
-    _HAS_WS = False
+# 受信JSONのフィールド候補（優先順）
+_MSG_KEYS = ("message", "text", "comment", "body", "content")
+_USER_KEYS = ("user", "name", "userName", "user_name", "author", "displayName")
+_USER_ID_KEYS = ("userId", "user_id", "id")
+_PLATFORM_KEYS = ("platform", "service", "source")
+
+
+_FIELD_KEYS = (_MSG_KEYS, _USER_KEYS, _USER_ID_KEYS, _PLATFORM_KEYS)
+_FIELD_DEFAULTS = ("", "Unknown", "", "unknown")
+
+
+def _first_key(obj: dict, keys: tuple):
+    """keys の順に obj を引き、最初に真値だったキーを返す（無ければNone）"""
+    for key in keys:
+        if obj.get(key):
+            return key
+    return None
+
+
+def _probe_schema(obj: dict) -> tuple:
+    """受信JSONの各フィールド（本文・ユーザー名・ユーザーID・プラットフォーム）に使うキーを判定"""
+    return tuple(_first_key(obj, keys) for keys in _FIELD_KEYS)
+
+
+def _extract_fields(obj: dict, schema: tuple):
+    """
+    判定済みスキーマでフィールドを取り出す
+
+    Returns:
+        tuple: (本文, ユーザー名, ユーザーID, プラットフォーム)。スキーマが合わなければNone
+    """
+    values = []
+    for key, keys, default in zip(schema, _FIELD_KEYS, _FIELD_DEFAULTS):
+        if key is None:
+            # 判定時に無かったフィールドは候補を引き直す（後から付くキーを取りこぼさない）
+            found = _first_key(obj, keys)
+            values.append(obj[found] if found else default)
+            continue
+        value = obj.get(key)
+        if not value:
+            return None
+        values.append(value)
+    return tuple(values)
+
+
+def _plain_payload(message) -> dict:
+    """JSONとして扱えない受信データをプレーンテキストのコメントにする"""
+    return build_plain_payload("manual", "Manual", str(message))
 
 
 class ManualConnector(BaseCommentConnector):
@@ -31,11 +72,13 @@ class ManualConnector(BaseCommentConnector):
     受信メッセージを柔軟に解析してコメントとして処理します。
     """
 
+    # WEBSOCKET_LOG に付けるプレフィックス（ログごとに f-string を組まない）
+    _UI_LOG_PREFIX = "[Manual] "
+
     def __init__(self, message_bus, logger):
         super().__init__(message_bus, logger)
-        self.ws = None
-        self._th = None
-        self._stopped = False
+        # 受信JSONのスキーマ（_probe_schema の結果）。同一接続ではほぼ固定なので使い回す
+        self._schema = None
 
     def connect(self, url: str) -> bool:
         """
@@ -48,168 +91,53 @@ class ManualConnector(BaseCommentConnector):
             bool: 接続開始に成功した場合True
         """
         self._url = url
-
-        if not _HAS_WS:
-            self._log("error", "websocket-client がインストールされていません")
-            self._publish_status("error", error="websocket-client not installed")
-            return False
-
-        # 既存の接続があれば停止
-        if self._th and self._th.is_alive():
-            self.disconnect()
-            time.sleep(0.5)
-
-        # 接続開始
-        self._stopped = False
-        self._start_connection()
-        return True
+        self._schema = None
+        return self._start_ws()
 
     def disconnect(self):
         """任意URL接続を切断"""
-        self._stopped = True
-        self.connected = False
+        self._stop_task()
 
-        try:
-            if self.ws and _HAS_WS:
-                self.ws.close()
-        except Exception:
-            pass
+    def _parse_frame(self, message) -> dict:
+        """
+        受信フレームをコメントペイロードに変換（フィールド名を柔軟に検出）
+
+        Args:
+            message: 受信データ（テキストフレームは str、バイナリフレームは bytes）
+        """
+        is_bytes = isinstance(message, (bytes, bytearray))
+
+        # JSON オブジェクト以外（プレーンテキスト）は json_loads を通さない
+        if not message.lstrip().startswith(b"{" if is_bytes else "{"):
+            if is_bytes:
+                message = message.decode("utf-8", "ignore")
+            return _plain_payload(message)
 
         try:
-            self._publish_status("disconnected")
-        except Exception:
-            pass
-
-    def _start_connection(self):
-        """WebSocket接続開始（スレッドで実行）"""
-
-        def _on_open(ws):
-            self._log("info", f"connected: {self._url}")
-            self._publish_status("connected")
-            self.connected = True
-
-        def _on_message(ws, message):
-            try:
-                # 受信メッセージをログ出力
-                self._log("debug", f"recv-raw: {str(message)[:200]}")
-
-                payload = None
-                if isinstance(message, (bytes, bytearray)):
-                    try:
-                        message = message.decode("utf-8", "ignore")
-                    except Exception:
-                        message = str(message)
-
-                try:
-                    obj = json.loads(message)
-
-                    # 柔軟なフィールド検出
-                    # よくあるフィールド名を複数試行
-                    message_text = (
-                        obj.get("message") or
-                        obj.get("text") or
-                        obj.get("comment") or
-                        obj.get("body") or
-                        obj.get("content") or
-                        ""
-                    )
-
-                    user_name = (
-                        obj.get("user") or
-                        obj.get("name") or
-                        obj.get("userName") or
-                        obj.get("user_name") or
-                        obj.get("author") or
-                        obj.get("displayName") or
-                        "Unknown"
-                    )
-
-                    user_id = (
-                        obj.get("userId") or
-                        obj.get("user_id") or
-                        obj.get("id") or
-                        ""
-                    )
-
-                    platform = (
-                        obj.get("platform") or
-                        obj.get("service") or
-                        obj.get("source") or
-                        "unknown"
-                    )
-
-                    payload = {
-                        "source": "manual",
-                        "platform": platform,
-                        "user_id": user_id,
-                        "user_name": user_name,
-                        "message": message_text,
-                        "raw": obj,
-                        # 後方互換用
-                        "text": message_text,
-                        "user": user_name,
-                    }
-                except Exception as e:
-                    self._log("warning", f"JSON parse error: {e}, treating as plain text")
-                    payload = {
-                        "source": "manual",
-                        "platform": "unknown",
-                        "user_id": "",
-                        "user_name": "Manual",
-                        "message": str(message),
-                        "raw": {},
-                        # 後方互換用
-                        "text": str(message),
-                        "user": "Manual",
-                    }
-
-                self._log("info", f"recv-parsed: text='{(payload.get('message') or '')[:80]}' user='{payload.get('user_name','')}'")
-
-                if payload and (payload.get("message") or "").strip():
-                    self._publish_comment(payload)
-                else:
-                    self._log("debug", "recv(no-text): skip")
-
-            except Exception as e:
-                self._log("error", f"message handler error: {e}")
-
-        def _on_error(ws, error):
-            self._log("error", f"{error}")
-            self._publish_status("error", error=str(error))
-            self.connected = False
-
-        def _on_close(ws, status_code, msg):
-            self._log("info", f"disconnected: code={status_code} msg={msg}")
-            self._publish_status("disconnected")
-            self.connected = False
-
-        def _runner():
-            try:
-                self.ws = websocket.WebSocketApp(
-                    self._url,
-                    on_open=_on_open,
-                    on_message=_on_message,
-                    on_error=_on_error,
-                    on_close=_on_close,
-                )
-                self.ws.run_forever(ping_interval=20, ping_timeout=10)
-            except Exception as e:
-                self._log("error", f"run_forever error: {e}")
-                self._publish_status("error", error=str(e))
-
-        self._th = threading.Thread(target=_runner, daemon=True)
-        self._th.start()
-
-    def _log(self, level: str, message: str):
-        """ログ出力"""
-        super()._log(level, message)
-
-        # WEBSOCKET_LOG イベント発行
-        try:
-            self.message_bus.publish(
-                "WEBSOCKET_LOG",
-                {"level": level, "msg": f"[Manual] {message}"},
-                sender=self.__class__.__name__,
-            )
-        except Exception:
-            pass
+            # bytes はデコードせずそのまま渡す
+            obj = json_loads(message)
+
+            # 柔軟なフィールド検出
+            # 前回のスキーマで取り出し、合わなければよくあるフィールド名を優先順に再判定
+            fields = _extract_fields(obj, self._schema) if self._schema else None
+            if fields is None:
+                self._schema = _probe_schema(obj)
+                fields = _extract_fields(obj, self._schema)
+            message_text, user_name, user_id, platform = fields
+
+            return {
+                "source": "manual",
+                "platform": platform,
+                "user_id": user_id,
+                "user_name": user_name,
+                "message": message_text,
+                "raw": obj,
+                # 後方互換用
+                "text": message_text,
+                "user": user_name,
+            }
+        except Exception as e:
+            self._log("warning", f"JSON parse error: {e}, treating as plain text")
+            if is_bytes:
+                message = message.decode("utf-8", "ignore")
+            return _plain_payload(message)
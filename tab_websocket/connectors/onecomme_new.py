@@ -29,6 +29,9 @@ class OneCommeNewConnector(BaseCommentConnector):
     TODO: 新しい接続方式の仕様が判明次第、実装を追加
     """
 
+    # WEBSOCKET_LOG に付けるプレフィックス（ログごとに f-string を組まない）
+    _UI_LOG_PREFIX = "[OneCommeNew] "
+
     def __init__(self, message_bus, logger):
         super().__init__(message_bus, logger)
         self.ws = None
@@ -76,27 +79,3 @@ class OneCommeNewConnector(BaseCommentConnector):
         self._log("info", "切断")
         self.connected = False
         self._publish_status("disconnected")
-
-        # WEBSOCKET_LOG イベント発行
-        try:
-            self.message_bus.publish(
-                "WEBSOCKET_LOG",
-                {"level": "info", "msg": "[OneCommeNew] 切断"},
-                sender=self.__class__.__name__,
-            )
-        except Exception:
-            pass
-
-    def _log(self, level: str, message: str):
-        """ログ出力"""
-        super()._log(level, message)
-
-        # WEBSOCKET_LOG イベント発行
-        try:
-            self.message_bus.publish(
-                "WEBSOCKET_LOG",
-                {"level": level, "msg": f"[OneCommeNew] {message}"},
-                sender=self.__class__.__name__,
-            )
-        except Exception:
-            pass
@@ -9,7 +9,7 @@ JSON形式のコメントを受信してMessageBusに送信します。
 - BaseCommentConnectorを継承した統一インターフェース
 - JSON 1行受信 → ONECOMME_COMMENT イベント発行
 - 接続失敗時の自動タイムアウト対応（MultiConnectionPanel側で処理）
-- スレッドセーフ設計
+- 受信は全コネクタ共有の asyncio ループで実行（接続ごとにスレッドを立てない）
 
 受信フォーマット（JSON）:
 {
@@ -20,11 +20,18 @@ JSON形式のコメントを受信してMessageBusに送信します。
 }
 """
 
+import asyncio
 import socket
-import json
-import threading
 from typing import Optional
-from .base import BaseCommentConnector
+from .base import BaseCommentConnector, json_loads
+
+# 受信ソケットバッファサイズ（コメントが集中しても1回の recv でまとめて受け取る）
+_RCVBUF_SIZE = 1024 * 1024
+# 1回の recv で受け取る最大バイト数（複数行をまとめて取り込む）
+_READ_BUFSIZE = 64 * 1024
+# 接続タイムアウト / 無受信で切断とみなすまでの秒数
+_CONNECT_TIMEOUT = 5.0
+_RECV_TIMEOUT = 30.0
 
 
 class TCPCommentClientConnector(BaseCommentConnector):
@@ -35,10 +42,13 @@ class TCPCommentClientConnector(BaseCommentConnector):
     MessageBusに送信します。
     """
 
+    # WEBSOCKET_LOG に付けるプレフィックス（ログごとに f-string を組まない）
+    _UI_LOG_PREFIX = "[TCP Client] "
+
     def __init__(self, message_bus, logger):
         super().__init__(message_bus, logger)
         self._socket: Optional[socket.socket] = None
-        self._thread: Optional[threading.Thread] = None
+        self._future = None
         self._stopped = False
         self._host = ""
         self._port = 0
@@ -69,14 +79,9 @@ class TCPCommentClientConnector(BaseCommentConnector):
         self._port = port
         self._url = url
 
-        # 既存の接続があれば切断
-        if self._thread and self._thread.is_alive():
-            self.disconnect()
-
-        # 接続開始
-        self._stopped = False
+        # 接続開始（既存の接続があれば切断してから）
         try:
-            self._start_client()
+            self._submit_task(self._client_loop)
             self._log("info", f"🔌 接続開始: {url}")
             return True
         except Exception as e:
@@ -86,98 +91,121 @@ class TCPCommentClientConnector(BaseCommentConnector):
 
     def disconnect(self):
         """TCP接続を切断"""
-        self._stopped = True
-        self.connected = False
-
-        # ソケットを閉じる
-        if self._socket:
-            try:
-                self._socket.close()
-            except Exception:
-                pass
-            self._socket = None
+        self._stop_task()
+        self._log("info", "🛑 切断完了")
 
-        # 受信スレッドの終了を待つ
-        if self._thread and self._thread.is_alive():
-            self._thread.join(timeout=2.0)
+    async def _client_loop(self, gen: int):
+        """
+        接続から切断までの受信ループ（共有ループ上で実行）
 
-        self._log("info", "🛑 切断完了")
-        self._publish_status("disconnected")
-
-    def _start_client(self):
-        """TCPクライアントを起動（別スレッドで実行）"""
-
-        def _client_loop():
-            try:
-                # ソケット作成
-                self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                self._socket.settimeout(5.0)  # 接続タイムアウト
-
-                # 接続
-                self._log("info", f"🔗 接続中: {self._host}:{self._port}")
-                self._socket.connect((self._host, self._port))
-
-                # 接続成功
-                self.connected = True
-                self._log("info", f"✅ 接続成功: {self._host}:{self._port}")
-                self._publish_status("connected")
-
-                # 受信タイムアウトを長めに設定（切断検知用）
-                self._socket.settimeout(30.0)
-
-                # ファイルオブジェクトとして扱う（行単位受信用）
-                with self._socket.makefile("r", encoding="utf-8") as f:
-                    while not self._stopped:
-                        # 1行読み込み
-                        line = f.readline()
-                        if not line:
-                            # EOF（サーバー側が切断）
-                            self._log("info", "📡 サーバーが切断しました")
-                            break
-
-                        line = line.strip()
-                        if not line:
-                            continue
-
-                        # JSON解析
-                        try:
-                            payload = json.loads(line)
-                        except json.JSONDecodeError as e:
-                            self._log("warning", f"⚠️ JSONデコードエラー: {line[:50]} → {e}")
-                            continue
-
-                        # コメント処理
-                        try:
-                            self._handle_comment(payload)
-                        except Exception as e:
-                            self._log("error", f"❌ コメント処理エラー: {e}")
-                            continue
-
-            except socket.timeout:
+        Args:
+            gen: _submit_task が割り当てた世代番号（置き換え後は状態を発行しない）
+        """
+        loop = asyncio.get_running_loop()
+        sock = None
+        try:
+            # ソケット作成（受信バッファは connect 前に広げる: TCP ウィンドウのネゴシエーションに反映させるため）
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self._socket = sock
+            sock.setblocking(False)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _RCVBUF_SIZE)
+            # 小さな行単位のやり取りなので Nagle を無効化、半開きの接続は OS の keepalive でも検出
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+            # 接続（Proactor ループの sock_connect は名前解決しないため先に解決しておく）
+            self._log("info", f"🔗 接続中: {self._host}:{self._port}")
+            infos = await loop.getaddrinfo(self._host, self._port, family=socket.AF_INET, type=socket.SOCK_STREAM)
+            await asyncio.wait_for(loop.sock_connect(sock, infos[0][4]), _CONNECT_TIMEOUT)
+
+            # 接続成功
+            self.connected = True
+            self._log("info", f"✅ 接続成功: {self._host}:{self._port}")
+            self._publish_status("connected")
+
+            # 受信バイト列を直接改行で切り出す（行ごとの str 化・strip をしない）
+            # 受信ごとの属性ルックアップを省くため、ループの外で束縛しておく
+            buf = bytearray()
+            find = buf.find
+            handle_line = self._handle_line
+            sock_recv = loop.sock_recv
+            wait_for = asyncio.wait_for
+            while gen == self._task_gen:
+                # 無受信が続いたら切断とみなす（切断検知用）
+                chunk = await wait_for(sock_recv(sock, _READ_BUFSIZE), _RECV_TIMEOUT)
+                if not chunk:
+                    # EOF（サーバー側が切断）。改行で終わっていない最終行も処理する
+                    if buf:
+                        handle_line(bytes(buf))
+                    self._log("info", "📡 サーバーが切断しました")
+                    break
+
+                buf += chunk
+                start = 0
+                while True:
+                    end = find(b"\n", start)
+                    if end < 0:
+                        break
+                    handle_line(bytes(buf[start:end]))
+                    start = end + 1
+                # 処理済みの行をまとめて捨てる（残りは次の recv と連結）
+                if start:
+                    del buf[:start]
+
+        except asyncio.CancelledError:
+            # disconnect() による停止（状態は disconnect 側で発行済み）
+            raise
+        except (asyncio.TimeoutError, socket.timeout):
+            if gen == self._task_gen:
                 self._log("error", "❌ 接続タイムアウト")
                 self._publish_status("error", error="接続タイムアウト")
-            except ConnectionRefusedError:
+        except ConnectionRefusedError:
+            if gen == self._task_gen:
                 self._log("error", f"❌ 接続拒否: {self._host}:{self._port}")
                 self._publish_status("error", error="接続拒否（サーバーが起動していない可能性）")
-            except Exception as e:
-                if not self._stopped:
-                    self._log("error", f"❌ クライアントループエラー: {e}")
-                    self._publish_status("error", error=str(e))
-            finally:
-                self.connected = False
-                if self._socket:
-                    try:
-                        self._socket.close()
-                    except Exception:
-                        pass
+        except Exception as e:
+            if gen == self._task_gen:
+                self._log("error", f"❌ クライアントループエラー: {e}")
+                self._publish_status("error", error=str(e))
+        finally:
+            # 閉じるのはこのタスクが作ったソケットだけ（self._socket は新タスクのものかもしれない）
+            if sock is not None:
+                try:
+                    sock.close()
+                except Exception:
+                    pass
+                if self._socket is sock:
                     self._socket = None
 
-                if not self._stopped:
-                    self._log("info", "🛑 接続終了")
-                    self._publish_status("disconnected")
+            # 新しいタスクに置き換わっていれば、その接続状態には触れない
+            if gen == self._task_gen:
+                self.connected = False
+                self._log("info", "🛑 接続終了")
+                self._publish_status("disconnected")
 
-        self._thread = threading.Thread(target=_client_loop, daemon=True)
-        self._thread.start()
+    def _handle_line(self, line: bytes):
+        """
+        受信した1行（改行を含まない）をJSONとして解析し、コメント処理へ渡す
+
+        Args:
+            line: 受信行のバイト列
+        """
+        # 空行（空白のみ）は無視
+        if not line or line.isspace():
+            return
+
+        # JSON解析（前後の空白・\r はデコーダが読み飛ばす）
+        try:
+            payload = json_loads(line)
+        except ValueError as e:
+            self._log("warning", f"⚠️ JSONデコードエラー: {line[:50].decode('utf-8', 'replace')} → {e}")
+            return
+
+        # コメント処理
+        try:
+            self._handle_comment(payload)
+        except Exception as e:
+            self._log("error", f"❌ コメント処理エラー: {e}")
 
     def _handle_comment(self, payload: dict):
         """
@@ -223,22 +251,3 @@ class TCPCommentClientConnector(BaseCommentConnector):
         }
 
         self._publish_comment(comment_payload)
-
-    def _log(self, level: str, message: str):
-        """
-        ログ出力（BaseCommentConnector をオーバーライド）
-
-        WEBSOCKET_LOG イベントも発行して、connection_panel のログに表示します。
-        """
-        # 親クラスのログ出力
-        super()._log(level, message)
-
-        # WEBSOCKET_LOG イベント発行（connection_panel が購読）
-        try:
-            self.message_bus.publish(
-                "WEBSOCKET_LOG",
-                {"level": level, "msg": f"[TCP Client] {message}"},
-                sender=self.__class__.__name__,
-            )
-        except Exception:
-            pass
@@ -8,7 +8,6 @@ message_bridge.py - OneComme WebSocket Bridge（v17.3.1）
 """
 import threading
 import json
-import time
 
 try:
     import websocket  # pip install websocket-client
@@ -16,6 +15,13 @@ try:
 except Exception:
     _HAS_WS = False
 
+# orjson があれば高速デコーダを使用（bytes をそのまま受け付ける）
+try:
+    import orjson
+    _json_loads = orjson.loads
+except Exception:
+    _json_loads = json.loads
+
 _bridge_singleton = None
 
 class _Bridge:
@@ -26,6 +32,8 @@ class _Bridge:
         self._th = None
         self._stopped = False
         self._connected_once = False
+        # stop() で再接続待ちを即座に打ち切るためのイベント
+        self._stop_evt = threading.Event()
 
     def start(self):
         if _HAS_WS:
@@ -39,6 +47,11 @@ class _Bridge:
         self._backoff = 1.0  # 秒（指数バックオフ最小）
         self._backoff_max = 10.0
 
+        # 受信ごとのグローバル / 属性ルックアップを省くため、クロージャ用に束縛しておく
+        loads = _json_loads
+        log = self._log
+        publish = self.bus.publish
+
         def _on_open(ws):
             self._log("info", f"connected: {self.url}")
             self._publish_status("connected")
@@ -52,14 +65,9 @@ class _Bridge:
                 # recv-raw, recv-parsed などの詳細ログは標準ロガーのみに出力
 
                 payload = None
-                if isinstance(message, (bytes, bytearray)):
-                    try:
-                        message = message.decode("utf-8", "ignore")
-                    except Exception:
-                        message = str(message)
-
                 try:
-                    obj = json.loads(message)
+                    # bytes はデコードせずそのまま渡す（UTF-8 検証もデコーダに任せる）
+                    obj = loads(message)
 
                     # --- 名前の抽出（UI用・内部用共通） ---
                     name = (
@@ -100,6 +108,8 @@ class _Bridge:
                     }
                 except Exception:
                     # JSONパースに失敗した場合でも最低限の情報で流す
+                    if isinstance(message, (bytes, bytearray)):
+                        message = message.decode("utf-8", "ignore")
                     text = str(message)
                     name = "OneComme"
                     payload = {
@@ -113,10 +123,10 @@ class _Bridge:
                 if payload and (payload.get("text") or "").strip():
                     text = (payload.get("text") or "")[:30]
                     user = payload.get("user", "")
-                    self._log("info", f"💬 {user}: {text}...")
-                    self.bus.publish("ONECOMME_COMMENT", payload, sender="onecomme_bridge")
+                    log("info", f"💬 {user}: {text}...")
+                    publish("ONECOMME_COMMENT", payload, sender="onecomme_bridge")
             except Exception as e:
-                self._log("error", f"parse-error: {e}")
+                log("error", f"parse-error: {e}")
 
         def _on_error(ws, error):
             self._log("error", f"{error}")
@@ -137,7 +147,8 @@ class _Bridge:
                         on_close=_on_close,
                     )
                     # ★ KeepAlive設定（サーバ実装に依存）
-                    self.ws.run_forever(ping_interval=20, ping_timeout=10)
+                    # UTF-8 検証は受信後のデコーダ（orjson / json）でも行われるため、ライブラリ側の走査は省く
+                    self.ws.run_forever(ping_interval=20, ping_timeout=10, skip_utf8_validation=True)
                 except Exception as e:
                     self._log("error", f"run_forever error: {e}")
                     self._publish_status("error", error=str(e))
@@ -149,7 +160,8 @@ class _Bridge:
                 # ★ 再接続バックオフ
                 sleep_sec = min(self._backoff, self._backoff_max)
                 self._log("info", f"reconnect in {sleep_sec:.1f}s")
-                time.sleep(sleep_sec)
+                if self._stop_evt.wait(sleep_sec):
+                    break
                 self._backoff = min(self._backoff * 2, self._backoff_max)
 
         self._th = threading.Thread(target=_runner, daemon=True)
@@ -157,6 +169,7 @@ class _Bridge:
 
     def stop(self):
         self._stopped = True
+        self._stop_evt.set()
         # ★ これ以上の再接続を止める
         try:
             self._reconnect = False
@@ -14,21 +14,16 @@ multi_connection_panel.py - v17.5 Multi Comment Bridge UI
 
 import tkinter as tk
 from tkinter import ttk
-import threading
+import importlib
 import logging
-import time
-
-from .connectors import (
-    OneCommeLegacyConnector,
-    OneCommeNewConnector,
-    MultiViewerConnector,
-    ManualConnector,
-    BouyomiCompatServerConnector,
-    TCPCommentClientConnector,
-)
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
+# ConnectorRow._log のレベル名 → ロガーメソッド（呼び出しごとの getattr を省く）
+_LOG_METHODS = {name: getattr(logger, name) for name in ("debug", "info", "warning", "error", "exception")}
+
 # --------------------------------------------------
 # デフォルトURL定義
 # --------------------------------------------------
@@ -39,6 +34,23 @@ DEFAULT_URLS = {
     "manual": "ws://localhost:8080",
 }
 
+# ログ欄への追記はまとめて行う（Text の再描画を行ごとではなく一定間隔に1回にする）
+_LOG_FLUSH_MS = 50
+_LOG_FLUSH_MAX = 500     # 1回のフラッシュで追記する最大件数
+_LOG_MAX_LINES = 2000    # ログ欄に残す最大行数（古い行から削除）
+
+# 設定保存の遅延（最後の変更からこの時間だけ待ってまとめて保存）
+_CONFIG_SAVE_DELAY_MS = 500
+
+# 接続タイムアウト（この時間内に connected が届かなければ自動OFF）
+_CONNECT_TIMEOUT_MS = 3000
+_MSG_CONNECT_TIMEOUT = "⚠️ 接続タイムアウト（3秒）→ 自動OFF"
+
+
+def _is_port_text(text: str) -> bool:
+    """ポート入力欄の入力検証（validatecommand 用。空欄か5桁以内の半角数字のみ許可）"""
+    return text == "" or (len(text) <= 5 and text.isascii() and text.isdigit())
+
 
 class ConnectorRow(ttk.Frame):
     """
@@ -59,19 +71,23 @@ class ConnectorRow(ttk.Frame):
         default_url: str = "",
         on_log_callback=None,
         input_mode: str = "url",  # "url" または "port"
+        on_config_changed=None,
+        executor=None,
     ):
         """
         Args:
             parent: 親ウィジェット
             label: 表示ラベル（例: "OneComme（旧方式）"）
             connector_id: コネクタ識別子（例: "onecomme_legacy"）
-            connector_class: コネクタクラス
+            connector_class: コネクタクラス、またはクラス名（connectors パッケージから初回接続時に import）
             message_bus: MessageBusインスタンス
             logger_instance: ロガーインスタンス
             config_manager: UnifiedConfigManager（オプション）
             default_url: デフォルトURL（input_mode="port"の場合はポート番号文字列）
             on_log_callback: ログ出力コールバック
             input_mode: 入力モード（"url" または "port"）
+            on_config_changed: 設定変更時のコールバック（保存の予約用。未指定ならその場で save）
+            executor: connect() を実行する共有 ThreadPoolExecutor（未指定なら行ごとに1ワーカーを用意）
         """
         super().__init__(parent)
 
@@ -83,20 +99,38 @@ class ConnectorRow(ttk.Frame):
         self.config_manager = config_manager
         self.on_log = on_log_callback
         self.input_mode = input_mode
+        self.on_config_changed = on_config_changed
+        # connect() の実行先（スレッドは初回 submit 時に作られる）
+        self.executor = executor or ThreadPoolExecutor(max_workers=1, thread_name_prefix="ws-connect")
+        # ログのプレフィックス（ラベルは不変なので1回だけ組み立てる）
+        self._log_prefix = f"[{label}] "
+        # 設定キー・入力欄名（入力モードごとに固定）
+        if input_mode == "port":
+            self._config_key = f"connections.{connector_id}.port"
+            self._field_name = "ポート"
+        else:
+            self._config_key = f"websocket.{connector_id}.url"
+            self._field_name = "URL"
 
         # コネクタインスタンス
         self.connector = None
 
         # 接続状態
         self.connected = False
-        self._timeout_timer = None
+        # 接続タイムアウト監視の after ID（接続要求ごとに1つ）
+        self._timeout_after_id = None
+        # 最後に ConfigManager へ書いた値（同じ値での再接続では書き直さない）
+        self._saved_value = None
+        # この行の connect/disconnect をワーカー上で順番に実行するための直前の Future
+        self._last_op = None
+        # 接続/切断要求の通し番号（古い接続要求の結果を無視するため）
+        self._request_seq = 0
 
         # URL/ポート初期値（Config → デフォルトの順で採用）
         initial_url = default_url
         if self.config_manager is not None:
             try:
-                config_key = f"websocket.{connector_id}.url" if input_mode == "url" else f"connections.{connector_id}.port"
-                initial_url = str(self.config_manager.get(config_key, default_url))
+                initial_url = str(self.config_manager.get(self._config_key, default_url))
             except Exception as e:
                 logger.warning(f"⚠️ {connector_id} 設定読み込み失敗: {e}")
 
@@ -123,7 +157,15 @@ class ConnectorRow(ttk.Frame):
         # URL/ポート入力欄
         if self.input_mode == "port":
             ttk.Label(self, text="ポート:").pack(side=tk.LEFT)
-            self.url_entry = ttk.Entry(self, textvariable=self.url_var, width=10)
+            # 数字以外はキー入力の時点で弾く
+            vcmd = (self.register(_is_port_text), "%P")
+            self.url_entry = ttk.Entry(
+                self,
+                textvariable=self.url_var,
+                width=10,
+                validate="key",
+                validatecommand=vcmd,
+            )
             self.url_entry.pack(side=tk.LEFT, padx=(4, 0))
         else:
             ttk.Label(self, text="URL:").pack(side=tk.LEFT)
@@ -142,86 +184,185 @@ class ConnectorRow(ttk.Frame):
         """接続開始"""
         value = (self.url_var.get() or "").strip()
         if not value:
-            field_name = "ポート" if self.input_mode == "port" else "URL"
-            self._log("warning", f"⚠️ {field_name} が空です")
+            self._log("warning", f"⚠️ {self._field_name} が空です")
             self.var.set(False)
             return
 
-        # 設定をConfigManagerに保存
-        if self.config_manager is not None:
+        # port モードはポート番号として扱う（キー入力は検証済み。設定由来の初期値に備え形式と範囲を確認）
+        if self.input_mode == "port":
+            if not (_is_port_text(value) and 1 <= int(value) <= 65535):
+                self._log("warning", f"⚠️ 不正なポート番号: {value}")
+                self.var.set(False)
+                return
+            target = int(value)
+        else:
+            target = value
+
+        # 設定をConfigManagerに保存（前回と同じ値なら不要）
+        if self.config_manager is not None and value != self._saved_value:
             try:
-                if self.input_mode == "port":
-                    config_key = f"connections.{self.connector_id}.port"
-                    # ポート番号として保存（数値検証）
-                    try:
-                        port_num = int(value)
-                        self.config_manager.set(config_key, port_num)
-                    except ValueError:
-                        self._log("warning", f"⚠️ 不正なポート番号: {value}")
-                        self.var.set(False)
-                        return
-                else:
-                    config_key = f"websocket.{self.connector_id}.url"
-                    self.config_manager.set(config_key, value)
+                self.config_manager.set(self._config_key, target)
 
-                self.config_manager.save()
-                logger.info(f"💾 {self.connector_id} 設定を保存しました: {value}")
+                # 保存はパネル側でまとめて行う（トグルごとにディスクへ書かない）
+                if self.on_config_changed:
+                    self.on_config_changed()
+                else:
+                    self.config_manager.save()
+                self._saved_value = value
+                logger.info(f"💾 {self.connector_id} 設定を更新しました: {value}")
             except Exception as e:
                 logger.warning(f"⚠️ {self.connector_id} 設定の保存に失敗しました: {e}")
 
-        # コネクタインスタンス作成
-        if self.connector is None:
-            self.connector = self.connector_class(self.bus, self.logger_instance)
-
-        # 接続開始
+        # 接続開始（ワーカーで実行し、結果は UIスレッドの _on_connect_done で受け取る）
         self._log("info", f"🔌 接続要求: {value}")
         self.connected = False
 
-        try:
-            # port モードの場合は整数に変換して渡す
-            if self.input_mode == "port":
-                success = self.connector.connect(int(value))
-            else:
-                success = self.connector.connect(value)
-
-            if not success:
-                self._log("error", "❌ 接続開始に失敗しました")
-                self.var.set(False)
-                return
-        except Exception as e:
-            self._log("error", f"❌ 接続エラー: {e}")
-            self.var.set(False)
+        self._request_seq += 1
+        seq = self._request_seq
+        fut = self._submit_serial(self._connect_in_worker, target)
+        if fut is None:
             return
+        fut.add_done_callback(lambda f: self._post_to_ui(self._on_connect_done, f, seq))
 
         # タイムアウト監視（3秒） - v17.3 Phase 4
-        def _check_timeout():
-            time.sleep(3.0)
-            if not self.connected:
-                self._log("warning", "⚠️ 接続タイムアウト（3秒）→ 自動OFF")
+        # スレッドを立てず Tk のタイマーで待つ（コールバックはUIスレッドで実行される）
+        self._cancel_connect_timeout()
+        self._timeout_after_id = self.after(_CONNECT_TIMEOUT_MS, self._on_connect_timeout)
+
+    def _connect_in_worker(self, target) -> bool:
+        """
+        コネクタを用意して connect() を呼ぶ（ワーカースレッドで実行）
+
+        Args:
+            target: 接続先（URL 文字列、または port モードならポート番号）
+
+        Returns:
+            bool: connect() の戻り値
+        """
+        # コネクタインスタンス作成（クラス名指定なら、ここで初めて connectors を import）
+        # この行の操作は _submit_serial で直列化されているため、二重生成は起きない
+        if self.connector is None:
+            self.connector = self._resolve_connector_class()(self.bus, self.logger_instance)
+        return self.connector.connect(target)
+
+    def _disconnect_in_worker(self) -> bool:
+        """
+        connector.disconnect() を呼ぶ（ワーカースレッドで実行）
+
+        Returns:
+            bool: 切断対象のコネクタがあった場合True
+        """
+        if self.connector is None:
+            return False
+        self.connector.disconnect()
+        return True
+
+    def _submit_serial(self, fn, *args):
+        """
+        この行の直前の操作が終わってから fn(*args) を実行するよう共有ワーカーに投入（UIスレッドから呼ぶ）
+
+        共有 executor は複数ワーカーで動くため、同じ行の connect/disconnect が
+        同時に走らないよう、直前の Future の完了を待ってから実行します。
+        （キューは FIFO なので、直前の操作は必ず先にワーカーへ渡っている）
+
+        Returns:
+            Future: 投入した操作（executor 停止後は None）
+        """
+        prev = self._last_op
+
+        def _run():
+            if prev is not None:
                 try:
-                    self.var.set(False)
-                    if self.connector:
-                        self.connector.disconnect()
+                    prev.result()
                 except Exception:
                     pass
+            return fn(*args)
+
+        try:
+            fut = self.executor.submit(_run)
+        except RuntimeError:
+            # パネル破棄（executor 停止）後
+            return None
+        self._last_op = fut
+        return fut
+
+    def _post_to_ui(self, callback, *args):
+        """ワーカーの結果を UIスレッドへ渡す（Future の完了コールバック用）"""
+        try:
+            self.after(0, callback, *args)
+        except Exception:
+            # ウィジェット破棄後に完了した場合
+            pass
 
-        self._timeout_timer = threading.Thread(target=_check_timeout, daemon=True)
-        self._timeout_timer.start()
+    def _on_connect_done(self, fut, seq: int):
+        """接続開始の結果を反映（UIスレッドで実行）"""
+        # 後から切断/再接続が要求されていれば、この結果は古いので無視
+        # （切断要求は直列化されてこの接続の後に実行される）
+        if seq != self._request_seq:
+            return
+
+        try:
+            success = fut.result()
+        except Exception as e:
+            self._cancel_connect_timeout()
+            self._log("error", f"❌ 接続エラー: {e}")
+            self._safe_set(False)
+            return
+
+        if not success:
+            self._cancel_connect_timeout()
+            self._log("error", "❌ 接続開始に失敗しました")
+            self._safe_set(False)
+            return
+
+    def _on_connect_timeout(self):
+        """接続タイムアウト（3秒以内に connected が届かなければ自動OFF）"""
+        self._timeout_after_id = None
+        if not self.connected:
+            self._log("warning", _MSG_CONNECT_TIMEOUT)
+            self._safe_set(False)
+            self._request_seq += 1
+            self._submit_serial(self._disconnect_in_worker)
+
+    def _cancel_connect_timeout(self):
+        """接続タイムアウト監視を解除"""
+        if self._timeout_after_id is not None:
+            try:
+                self.after_cancel(self._timeout_after_id)
+            except Exception:
+                pass
+            self._timeout_after_id = None
+
+    def _resolve_connector_class(self):
+        """コネクタクラスを返す（クラス名で渡されていれば import して置き換える）"""
+        if isinstance(self.connector_class, str):
+            module = importlib.import_module(".connectors", __package__)
+            self.connector_class = getattr(module, self.connector_class)
+        return self.connector_class
 
     def _disconnect(self):
         """接続切断"""
-        if self.connector:
-            try:
-                self.connector.disconnect()
-                self._log("info", "🛑 切断しました")
-            except Exception as e:
-                self._log("error", f"❌ 切断エラー: {e}")
+        self._cancel_connect_timeout()
+        self._request_seq += 1
+
+        # 実行中の connect() と同時に走らないよう、同じ行の操作として直列に実行
+        fut = self._submit_serial(self._disconnect_in_worker)
+        if fut is not None:
+            fut.add_done_callback(lambda f: self._post_to_ui(self._on_disconnect_done, f))
 
         self.connected = False
 
+    def _on_disconnect_done(self, fut):
+        """切断の結果をログに反映（UIスレッドで実行）"""
+        try:
+            if fut.result():
+                self._log("info", "🛑 切断しました")
+        except Exception as e:
+            self._log("error", f"❌ 切断エラー: {e}")
+
     def on_status_update(self, state: str, connector_name: str):
         """
-        WS_STATUS イベントのハンドラ
+        WS_STATUS イベントのハンドラ（パネルが UIスレッドに渡してから呼ぶ）
 
         Args:
             state: 状態 ("connected", "disconnected", "error")
@@ -229,35 +370,47 @@ class ConnectorRow(ttk.Frame):
         """
         # 自分のコネクタかチェック
         if self.connector and connector_name == self.connector.__class__.__name__:
-            if state == "connected":
-                self.connected = True
-                self._log("info", "✅ 接続成功")
-                try:
-                    self.var.set(True)
-                except Exception:
-                    pass
-            elif state == "disconnected":
-                self.connected = False
-                self._log("info", "🛑 切断されました")
-                try:
-                    self.var.set(False)
-                except Exception:
-                    pass
-            elif state == "error":
-                self.connected = False
-                # エラーメッセージはコネクタ側でログ出力済み
-                try:
-                    self.var.set(False)
-                except Exception:
-                    pass
+            self._apply_status(state)
+
+    def _apply_status(self, state: str):
+        """
+        自分のコネクタの状態を反映（パネルがクラス名で行を引いた後に直接呼ぶ）
+
+        Args:
+            state: 状態 ("connected", "disconnected", "error")
+        """
+        # まだ接続していない行（コネクタ未生成）には届かないはずの通知
+        if self.connector is None:
+            return
+
+        if state in ("connected", "disconnected", "error"):
+            # 結果が出たのでタイムアウト監視は不要
+            self._cancel_connect_timeout()
+
+        if state == "connected":
+            self.connected = True
+            self._log("info", "✅ 接続成功")
+            self._safe_set(True)
+        elif state == "disconnected":
+            self.connected = False
+            self._log("info", "🛑 切断されました")
+            self._safe_set(False)
+        elif state == "error":
+            self.connected = False
+            # エラーメッセージはコネクタ側でログ出力済み
+            self._safe_set(False)
+
+    def _safe_set(self, value: bool):
+        """チェック状態を更新（ウィジェット破棄後に届いた通知は無視）"""
+        if self.winfo_exists():
+            self.var.set(value)
 
     def _log(self, level: str, message: str):
         """ログ出力"""
-        prefix = f"[{self.label}]"
-        full_message = f"{prefix} {message}"
+        full_message = self._log_prefix + message
 
         # ロガーに出力
-        log_method = getattr(logger, level, None)
+        log_method = _LOG_METHODS.get(level)
         if log_method:
             log_method(full_message)
 
@@ -284,15 +437,25 @@ class MultiConnectionPanel(ttk.Frame):
 
         # コネクタ行のリスト
         self.connector_rows = []
+        # コネクタクラス名 → 行（WS_STATUS の "connector" から直接引く）
+        self._rows_by_class = {}
 
         # WS_STATUSイベントのハンドラトークン
         self._subs = []
 
+        # ログ欄への未反映の追記と、フラッシュ予約済みか
+        self._log_buf = deque()
+        self._log_flush_scheduled = False
+
+        # 設定保存の after ID（保存待ちの間に変更があれば予約し直す）
+        self._config_save_after_id = None
+
         # UI構築
         self._build_ui()
 
-        # MessageBus購読
+        # MessageBus購読（購読後はトークンを固定）
         self._subscribe_bus()
+        self._subs = tuple(self._subs)
 
     def _build_ui(self):
         """UI構築"""
@@ -310,12 +473,13 @@ class MultiConnectionPanel(ttk.Frame):
         connector_area.pack(fill=tk.X, padx=(12, 6), pady=6)
 
         # v17.5 接続方式の配置（優先度順）
+        # connector_class はクラス名で指定（connectors の import は初回接続まで遅らせる）
         connectors_config = [
             # 1. 棒読みちゃん互換（わんコメ/OneComme/MCV対応）- TCP サーバ
             {
                 "label": "棒読み互換（わんコメ/OneComme/MCV対応）",
                 "connector_id": "mcv_bouyomi",
-                "connector_class": BouyomiCompatServerConnector,
+                "connector_class": "BouyomiCompatServerConnector",
                 "default_url": "50010",  # デフォルトポート
                 "input_mode": "port",
             },
@@ -323,7 +487,7 @@ class MultiConnectionPanel(ttk.Frame):
             {
                 "label": "TCPコメント（外部サーバー）[実装途中]",
                 "connector_id": "tcp_comment_client",
-                "connector_class": TCPCommentClientConnector,
+                "connector_class": "TCPCommentClientConnector",
                 "default_url": "127.0.0.1:50000",  # デフォルト: host:port
                 "input_mode": "url",
             },
@@ -331,7 +495,7 @@ class MultiConnectionPanel(ttk.Frame):
             {
                 "label": "任意URL（自前接続）[実装途中]",
                 "connector_id": "manual",
-                "connector_class": ManualConnector,
+                "connector_class": "ManualConnector",
                 "default_url": DEFAULT_URLS["manual"],
                 "input_mode": "url",
             },
@@ -339,7 +503,7 @@ class MultiConnectionPanel(ttk.Frame):
             {
                 "label": "OneComme（新方式）[実装途中]",
                 "connector_id": "onecomme_new",
-                "connector_class": OneCommeNewConnector,
+                "connector_class": "OneCommeNewConnector",
                 "default_url": DEFAULT_URLS["onecomme_new"],
                 "input_mode": "url",
             },
@@ -347,12 +511,18 @@ class MultiConnectionPanel(ttk.Frame):
             {
                 "label": "OneComme（旧方式）[実装途中]",
                 "connector_id": "onecomme_legacy",
-                "connector_class": OneCommeLegacyConnector,
+                "connector_class": "OneCommeLegacyConnector",
                 "default_url": DEFAULT_URLS["onecomme_legacy"],
                 "input_mode": "url",
             },
         ]
 
+        # connect() と設定保存を実行する共有ワーカー（行ごと・保存ごとにスレッドを立てない）
+        self.executor = ThreadPoolExecutor(
+            max_workers=min(8, len(connectors_config) + 2),
+            thread_name_prefix="mcb",
+        )
+
         for cfg in connectors_config:
             row = ConnectorRow(
                 connector_area,
@@ -365,9 +535,15 @@ class MultiConnectionPanel(ttk.Frame):
                 default_url=cfg["default_url"],
                 on_log_callback=self._append_log,
                 input_mode=cfg.get("input_mode", "url"),
+                on_config_changed=self._schedule_config_save,
+                executor=self.executor,
             )
             row.pack(fill=tk.X, pady=2)
             self.connector_rows.append(row)
+            self._rows_by_class[cfg["connector_class"]] = row
+
+        # 行は構築後に増減しないので固定
+        self.connector_rows = tuple(self.connector_rows)
 
         # ログ表示欄
         log_frame = ttk.LabelFrame(self, text="接続ログ")
@@ -379,18 +555,87 @@ class MultiConnectionPanel(ttk.Frame):
             bg="black",
             fg="white",
             wrap="none",
+            undo=False,
+            maxundo=0,
         )
         self.log_text.pack(fill=tk.BOTH, expand=True, padx=4, pady=4)
         self.log_text.insert("end", "=== v17.5 Multi Comment Bridge Log ===\n")
+        # 表示専用（追記時だけ normal に戻す。カーソル・キー入力の処理を省く）
+        self.log_text.configure(state="disabled")
 
     def _append_log(self, text: str):
-        """ログテキストに追記"""
+        """ログテキストに追記（_LOG_FLUSH_MS ごとにまとめて反映）"""
+        self._log_buf.append(text)
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            try:
+                self.after(_LOG_FLUSH_MS, self._flush_log)
+            except Exception:
+                self._log_flush_scheduled = False
+
+    def _flush_log(self):
+        """溜まったログを1回の insert で反映し、上限を超えた古い行を削除"""
+        self._log_flush_scheduled = False
+        buf = self._log_buf
+        batch = [buf.popleft() for _ in range(min(len(buf), _LOG_FLUSH_MAX))]
+        if not batch:
+            return
+
         try:
-            self.log_text.insert("end", f"{text}\n")
-            self.log_text.see("end")
+            text = self.log_text
+            text.configure(state="normal")
+            text.insert("end", "\n".join(batch) + "\n")
+
+            # 行数の上限（末尾は改行で終わるため、"end-1c" の行番号 - 1 が行数）
+            excess = int(text.index("end-1c").split(".")[0]) - 1 - _LOG_MAX_LINES
+            if excess > 0:
+                text.delete("1.0", f"{excess + 1}.0")
+
+            text.configure(state="disabled")
+            text.yview_moveto(1.0)
         except Exception:
             pass
 
+        # 上限を超えて残った分は次の周期で反映
+        if buf:
+            self._log_flush_scheduled = True
+            self.after(_LOG_FLUSH_MS, self._flush_log)
+
+    def _schedule_config_save(self):
+        """設定保存を予約（_CONFIG_SAVE_DELAY_MS 以内の連続した変更は1回の保存にまとめる）"""
+        if self._config_save_after_id is not None:
+            try:
+                self.after_cancel(self._config_save_after_id)
+            except Exception:
+                pass
+        self._config_save_after_id = self.after(_CONFIG_SAVE_DELAY_MS, self._do_config_save)
+
+    def _do_config_save(self):
+        """設定をバックグラウンドで保存（ファイル書き込みでUIスレッドを止めない）"""
+        self._config_save_after_id = None
+        if self.config_manager is None:
+            return
+
+        def _save():
+            try:
+                self.config_manager.save()
+            except Exception as e:
+                logger.warning(f"⚠️ 接続設定の保存に失敗しました: {e}")
+
+        try:
+            self.executor.submit(_save)
+        except RuntimeError:
+            # パネル破棄（executor 停止）後に予約が走った場合
+            pass
+
+    def destroy(self):
+        """パネル破棄時に共有ワーカーを停止（実行中の connect / 保存は待たない）"""
+        try:
+            self.executor.shutdown(wait=False)
+        except Exception:
+            pass
+        super().destroy()
+
     def _subscribe_bus(self):
         """MessageBusイベント購読"""
         if not self.bus:
@@ -398,41 +643,61 @@ class MultiConnectionPanel(ttk.Frame):
 
         # WS_STATUS イベント購読
         try:
-            def _on_status(data, sender=None):
-                try:
-                    self._on_ws_status(data or {})
-                except Exception as e:
-                    logger.exception("WS_STATUS処理エラー: %s", e)
-
-            tok = self.bus.subscribe("WS_STATUS", _on_status)
+            tok = self.bus.subscribe("WS_STATUS", self._bus_on_status)
             self._subs.append(tok)
         except Exception:
             logger.exception("WS_STATUS購読エラー")
 
         # WEBSOCKET_LOG イベント購読（コネクタからのログ）
         try:
-            def _on_log(data, sender=None):
-                try:
-                    payload = data or {}
-                    level = payload.get("level", "info")
-                    msg = payload.get("msg", "")
-                    if msg:
-                        self._append_log(msg)
-                except Exception as e:
-                    logger.exception("WEBSOCKET_LOG処理エラー: %s", e)
-
-            tok = self.bus.subscribe("WEBSOCKET_LOG", _on_log)
+            tok = self.bus.subscribe("WEBSOCKET_LOG", self._bus_on_log)
             self._subs.append(tok)
         except Exception:
             logger.exception("WEBSOCKET_LOG購読エラー")
 
+    def _bus_on_status(self, data, sender=None):
+        """WS_STATUS の購読ハンドラ（発行元スレッドで呼ばれる）"""
+        # 発行元スレッドから直接ウィジェットに触れず、UIスレッドへ渡す
+        try:
+            self.after(0, self._on_ws_status, data or {})
+        except Exception as e:
+            logger.exception("WS_STATUS処理エラー: %s", e)
+
+    def _bus_on_log(self, data, sender=None):
+        """WEBSOCKET_LOG の購読ハンドラ（発行元スレッドで呼ばれる）"""
+        try:
+            payload = data or {}
+            level = payload.get("level", "info")
+            if level == "batch":
+                # コネクタ側でまとめ送りされたログは1回の追記で反映
+                lines = [m.msg for m in payload.get("msgs", ()) if m.msg]
+                if lines:
+                    self.after(0, self._append_log, "\n".join(lines))
+                return
+            msg = payload.get("msg", "")
+            if msg:
+                # 発行元スレッドから直接ウィジェットに触れず、UIスレッドへ渡す
+                self.after(0, self._append_log, msg)
+        except Exception as e:
+            logger.exception("WEBSOCKET_LOG処理エラー: %s", e)
+
     def _on_ws_status(self, data: dict):
-        """WS_STATUS イベントハンドラ"""
+        """WS_STATUS イベントハンドラ（UIスレッドで実行）"""
         try:
             state = data.get("state", "")
             connector_name = data.get("connector", "")
 
-            # 各コネクタ行に通知
+            # 該当するコネクタ行だけに反映（クラス名は索引で一致済みなので行側の照合は省く）
+            if connector_name:
+                row = self._rows_by_class.get(connector_name)
+                if row is not None:
+                    try:
+                        row._apply_status(state)
+                    except Exception as e:
+                        logger.exception(f"コネクタ行のステータス更新エラー: {e}")
+                return
+
+            # connector が無い発行元のみ全行に通知（各行が自分宛てか判定）
             for row in self.connector_rows:
                 try:
                     row.on_status_update(state, connector_name)
@@ -3,11 +3,13 @@
 test_mocks.py - テスト用モック群
 """
 import logging
+from collections import deque
 logger = logging.getLogger(__name__)
 
 class MockBus:
     def __init__(self):
-        self.events = []
+        # 長時間の負荷テストでも増え続けないよう直近分だけ保持
+        self.events = deque(maxlen=10000)
 
     def publish(self, ev, data=None, sender=None):
         msg = {"event": ev, "data": data, "sender": sender}
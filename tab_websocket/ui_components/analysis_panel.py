@@ -8,10 +8,18 @@ MessageBus を渡されれば自動購読して数値更新する。
 import tkinter as tk
 from tkinter import ttk
 
+# コメント数の表示更新をまとめる間隔（ms）
+_COMMENT_APPLY_MS = 100
+
 class _Counter:
     def __init__(self):
         self.comments = 0
         self.connected = False
+        # 表示中の文字列（変化が無ければ StringVar.set しない）
+        self.shown_conn = None
+        self.shown_cnt = None
+        # コメント受信による表示更新が予約済みか
+        self.apply_pending = False
 
 def create_analysis_panel(parent, message_bus=None):
     """
@@ -34,8 +42,18 @@ def create_analysis_panel(parent, message_bus=None):
     ttk.Label(row2, textvariable=v_cnt).pack(side=tk.LEFT, padx=(6,0))
 
     def _apply():
-        v_conn.set("✅ 接続中" if counter.connected else "⛔ 未接続")
-        v_cnt.set(str(counter.comments))
+        conn = "✅ 接続中" if counter.connected else "⛔ 未接続"
+        if conn != counter.shown_conn:
+            counter.shown_conn = conn
+            v_conn.set(conn)
+        cnt = str(counter.comments)
+        if cnt != counter.shown_cnt:
+            counter.shown_cnt = cnt
+            v_cnt.set(cnt)
+
+    def _apply_pending():
+        counter.apply_pending = False
+        _apply()
 
     def _update(payload: dict):
         if "connected" in payload:
@@ -53,7 +71,13 @@ def create_analysis_panel(parent, message_bus=None):
                     _apply()
             def _on_comment(data, sender=None):
                 counter.comments += 1
-                _apply()
+                # 連続受信時は _COMMENT_APPLY_MS ごとに1回だけ表示を更新
+                if not counter.apply_pending:
+                    counter.apply_pending = True
+                    try:
+                        frm.after(_COMMENT_APPLY_MS, _apply_pending)
+                    except Exception:
+                        counter.apply_pending = False
             message_bus.subscribe("WS_STATUS", _on_status)
             message_bus.subscribe("ONECOMME_COMMENT", _on_comment)
         except Exception: